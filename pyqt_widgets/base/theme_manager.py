@@ -91,11 +91,13 @@ class ThemeManager(QObject):
                 }
             }
         }
+        self._colors = self._themes[self._current_theme]["colors"]
 
     def set_theme(self, theme_name: str):
         """Set the current theme."""
         if theme_name in self._themes:
             self._current_theme = theme_name
+            self._colors = self._themes[theme_name]["colors"]
             self.theme_changed.emit()
 
     def get_current_theme(self) -> str:
@@ -104,7 +106,7 @@ class ThemeManager(QObject):
 
     def get_color(self, color_name: str) -> str:
         """Get a color value from the current theme."""
-        return self._themes[self._current_theme]["colors"].get(color_name, "#000000")
+        return self._colors.get(color_name, "#000000")
 
     def get_font(self, font_name: str) -> QFont:
         """Get a font from the current theme."""
@@ -2,6 +2,8 @@
 Property grid widget for editing key-value pairs.
 """
 
+from types import MappingProxyType
+
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTreeWidget,
                              QTreeWidgetItem, QLineEdit, QComboBox, QCheckBox,
                              QSpinBox, QDoubleSpinBox, QPushButton, QColorDialog,
@@ -310,8 +312,12 @@ class PropertyGridWidget(QWidget):
         # This would need default values to be stored
         pass
 
-    def get_all_properties(self) -> dict:
-        """Get all property values."""
+    def get_all_properties(self) -> MappingProxyType:
+        """Get a read-only live view of all property values."""
+        return MappingProxyType(self._properties)
+
+    def snapshot(self) -> dict:
+        """Get a detached copy of all property values."""
         return self._properties.copy()
 
     def set_properties(self, properties: dict):
@@ -265,8 +265,16 @@ class TimelineWidget(QWidget):
             del self._events[index]
             self._rebuild_timeline()
 
-    def get_events(self) -> list:
-        """Get all events."""
+    def get_events(self) -> tuple:
+        """Get all events as an immutable sequence."""
+        return tuple(self._events)
+
+    def iter_events(self):
+        """Iterate over events without copying."""
+        return iter(self._events)
+
+    def snapshot(self) -> list:
+        """Get a detached copy of all events."""
         return self._events.copy()
 
     def set_orientation(self, orientation: Qt.Orientation):
@@ -2,13 +2,77 @@
 Enhanced tree view widget with icons and animations.
 """
 
+import atexit
+import os
+import shutil
+import tempfile
+from collections import deque
+from functools import partial
+
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTreeWidget,
                              QTreeWidgetItem, QLabel, QPushButton, QLineEdit,
-                             QCheckBox, QMenu)
-from PyQt6.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve
+                             QCheckBox, QMenu, QTreeWidgetItemIterator,
+                             QFileIconProvider)
+from PyQt6.QtCore import (Qt, pyqtSignal, QPropertyAnimation, QEasingCurve, QTimer, QFileInfo,
+                          QThread)
+from PyQt6 import sip
 from PyQt6.QtGui import QFont, QIcon, QAction
 from ..base.theme_manager import theme_manager
 
+# Item data role holding the lowercased text used for search matching
+SEARCH_TEXT_ROLE = Qt.ItemDataRole.UserRole + 1
+
+# Item data roles CheckableTreeView uses to track check state incrementally
+_CHECKED_COUNT_ROLE = Qt.ItemDataRole.UserRole + 2
+_WAS_CHECKED_ROLE = Qt.ItemDataRole.UserRole + 3
+
+# File extension (lowercase, with dot) to file type
+_FILE_TYPE_MAP = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.html': 'html',
+    '.css': 'css',
+    '.txt': 'text',
+    '.md': 'markdown',
+    '.json': 'json',
+    '.xml': 'xml',
+    '.png': 'image',
+    '.jpg': 'image',
+    '.jpeg': 'image',
+    '.gif': 'image',
+    '.pdf': 'pdf',
+    '.doc': 'document',
+    '.docx': 'document'
+}
+
+# Branch indicator icons, written to disk once and referenced by path in QSS
+_BRANCH_CLOSED_SVG = (b'<svg width="16" height="16" viewBox="0 0 16 16" fill="none" '
+                      b'xmlns="http://www.w3.org/2000/svg">\n'
+                      b'<path d="M6 4L10 8L6 12V4Z" fill="#6B7280"/>\n</svg>\n')
+_BRANCH_OPEN_SVG = (b'<svg width="16" height="16" viewBox="0 0 16 16" fill="none" '
+                    b'xmlns="http://www.w3.org/2000/svg">\n'
+                    b'<path d="M4 6L8 10L12 6H4Z" fill="#6B7280"/>\n</svg>\n')
+_branch_icon_paths = None
+
+
+def _get_branch_icon_paths() -> tuple:
+    """Get (closed, open) branch icon file paths, creating them on first use."""
+    global _branch_icon_paths
+    if _branch_icon_paths is None:
+        icon_dir = tempfile.mkdtemp(prefix="pyqt_widgets_")
+        atexit.register(shutil.rmtree, icon_dir, True)
+
+        paths = []
+        for name, svg in (("branch_closed.svg", _BRANCH_CLOSED_SVG),
+                          ("branch_open.svg", _BRANCH_OPEN_SVG)):
+            path = os.path.join(icon_dir, name)
+            with open(path, "wb") as f:
+                f.write(svg)
+            paths.append(path.replace(os.sep, "/"))
+        _branch_icon_paths = tuple(paths)
+
+    return _branch_icon_paths
+
 
 class TreeViewWidget(QWidget):
     """Enhanced tree view with search, icons, and animations."""
@@ -18,11 +82,19 @@ class TreeViewWidget(QWidget):
     item_expanded = pyqtSignal(QTreeWidgetItem)
     item_collapsed = pyqtSignal(QTreeWidgetItem)
 
+    # Stylesheets keyed by (part, theme), shared by all instances
+    _stylesheet_cache = {}
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._checkable = False
         self._searchable = True
         self._animated = True
+        self._context_menu = None
+        self._context_target = None
+        self._icon_provider = QFileIconProvider()
+        self._icon_cache = {}
+        self._filter_text = ""  # Search text of the filter currently applied
         self._setup_ui()
 
     def _setup_ui(self):
@@ -41,6 +113,7 @@ class TreeViewWidget(QWidget):
         self.tree.setHeaderHidden(True)
         self.tree.setAlternatingRowColors(True)
         self.tree.setAnimated(self._animated)
+        self.tree.setUniformRowHeights(True)
 
         # Connect signals
         self.tree.itemClicked.connect(self.item_clicked.emit)
@@ -49,40 +122,100 @@ class TreeViewWidget(QWidget):
         self.tree.itemCollapsed.connect(self.item_collapsed.emit)
 
         # Styling
-        self.tree.setStyleSheet(f"""
+        self.tree.setStyleSheet(self._get_stylesheet("tree"))
+
+        main_layout.addWidget(self.tree)
+
+        # Context menu
+        self.tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.tree.customContextMenuRequested.connect(self._show_context_menu)
+
+    @classmethod
+    def _get_stylesheet(cls, part: str) -> str:
+        """Get the stylesheet for a widget part, shared per theme."""
+        key = (part, theme_manager.get_current_theme())
+        stylesheet = TreeViewWidget._stylesheet_cache.get(key)
+        if stylesheet is None:
+            builders = {
+                "tree": cls._build_tree_stylesheet,
+                "search_input": cls._build_search_input_stylesheet,
+                "clear_button": cls._build_clear_button_stylesheet,
+            }
+            stylesheet = builders[part]()
+            TreeViewWidget._stylesheet_cache[key] = stylesheet
+        return stylesheet
+
+    @staticmethod
+    def _build_tree_stylesheet() -> str:
+        """Build the tree widget stylesheet."""
+        branch_closed, branch_open = _get_branch_icon_paths()
+        border = theme_manager.get_color('border')
+        surface = theme_manager.get_color('surface')
+        hover = theme_manager.get_color('hover')
+        primary = theme_manager.get_color('primary')
+        radius_md = theme_manager.get_border_radius('md')
+        return f"""
             QTreeWidget {{
-                border: 1px solid {theme_manager.get_color('border')};
-                border-radius: {theme_manager.get_border_radius('md')}px;
-                background-color: {theme_manager.get_color('surface')};
-                alternate-background-color: {theme_manager.get_color('hover')};
+                border: 1px solid {border};
+                border-radius: {radius_md}px;
+                background-color: {surface};
+                alternate-background-color: {hover};
             }}
             QTreeWidget::item {{
                 padding: 4px;
                 border-bottom: 1px solid transparent;
             }}
             QTreeWidget::item:selected {{
-                background-color: {theme_manager.get_color('primary')};
+                background-color: {primary};
                 color: white;
             }}
             QTreeWidget::item:hover {{
-                background-color: {theme_manager.get_color('hover')};
+                background-color: {hover};
             }}
             QTreeWidget::branch {{
                 background: transparent;
             }}
             QTreeWidget::branch:has-children:closed {{
-                image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTYiIGhlaWdodD0iMTYiIHZpZXdCb3g9IjAgMCAxNiAxNiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTYgNEwxMCA4TDYgMTJWNFoiIGZpbGw9IiM2QjcyODAiLz4KPHN2Zz4K);
+                image: url("{branch_closed}");
             }}
             QTreeWidget::branch:has-children:open {{
-                image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTYiIGhlaWdodD0iMTYiIHZpZXdCb3g9IjAgMCAxNiAxNiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTQgNkw4IDEwTDEyIDZINFoiIGZpbGw9IiM2QjcyODAiLz4KPHN2Zz4K);
+                image: url("{branch_open}");
             }}
-        """)
-
-        main_layout.addWidget(self.tree)
-
-        # Context menu
-        self.tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.tree.customContextMenuRequested.connect(self._show_context_menu)
+        """
+
+    @staticmethod
+    def _build_search_input_stylesheet() -> str:
+        """Build the search input stylesheet."""
+        border = theme_manager.get_color('border')
+        surface = theme_manager.get_color('surface')
+        radius_sm = theme_manager.get_border_radius('sm')
+        return f"""
+            QLineEdit {{
+                padding: 6px 12px;
+                border: 1px solid {border};
+                border-radius: {radius_sm}px;
+                background-color: {surface};
+            }}
+        """
+
+    @staticmethod
+    def _build_clear_button_stylesheet() -> str:
+        """Build the clear button stylesheet."""
+        border = theme_manager.get_color('border')
+        light = theme_manager.get_color('light')
+        hover = theme_manager.get_color('hover')
+        radius_sm = theme_manager.get_border_radius('sm')
+        return f"""
+            QPushButton {{
+                padding: 6px 12px;
+                border: 1px solid {border};
+                border-radius: {radius_sm}px;
+                background-color: {light};
+            }}
+            QPushButton:hover {{
+                background-color: {hover};
+            }}
+        """
 
     def _create_search_bar(self, layout):
         """Create search functionality."""
@@ -94,41 +227,41 @@ class TreeViewWidget(QWidget):
         # Search input
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search...")
-        self.search_input.textChanged.connect(self._filter_items)
-        self.search_input.setStyleSheet(f"""
-            QLineEdit {{
-                padding: 6px 12px;
-                border: 1px solid {theme_manager.get_color('border')};
-                border-radius: {theme_manager.get_border_radius('sm')}px;
-                background-color: {theme_manager.get_color('surface')};
-            }}
-        """)
+        self.search_input.textChanged.connect(self._on_search_text_changed)
+        self.search_input.setStyleSheet(self._get_stylesheet("search_input"))
         search_layout.addWidget(self.search_input)
 
         # Clear button
         clear_btn = QPushButton("Clear")
         clear_btn.clicked.connect(self._clear_search)
-        clear_btn.setStyleSheet(f"""
-            QPushButton {{
-                padding: 6px 12px;
-                border: 1px solid {theme_manager.get_color('border')};
-                border-radius: {theme_manager.get_border_radius('sm')}px;
-                background-color: {theme_manager.get_color('light')};
-            }}
-            QPushButton:hover {{
-                background-color: {theme_manager.get_color('hover')};
-            }}
-        """)
+        clear_btn.setStyleSheet(self._get_stylesheet("clear_button"))
         search_layout.addWidget(clear_btn)
 
         layout.addWidget(search_container)
 
+        # Search delay timer
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.timeout.connect(
+            lambda: self._filter_items(self.search_input.text()))
+
+    def _on_search_text_changed(self, text: str):
+        """Restart the debounce timer on each keystroke."""
+        self._search_timer.start(150)  # 150ms debounce
+
     def add_item(self, text: str, parent=None, icon=None, data=None) -> QTreeWidgetItem:
         """Add item to tree."""
+        item = self._create_item(text, icon, data)
         if parent is None:
-            item = QTreeWidgetItem(self.tree, [text])
+            self.tree.addTopLevelItem(item)
         else:
-            item = QTreeWidgetItem(parent, [text])
+            parent.addChild(item)
+        return item
+
+    def _create_item(self, text: str, icon=None, data=None) -> QTreeWidgetItem:
+        """Create a detached item, ready to be attached to the tree."""
+        item = QTreeWidgetItem([text])
+        item.setData(0, SEARCH_TEXT_ROLE, text.lower())
 
         # Set icon if provided
         if icon:
@@ -157,49 +290,101 @@ class TreeViewWidget(QWidget):
 
     def _get_folder_icon(self) -> QIcon:
         """Get folder icon."""
-        # In a real implementation, you'd load actual icons
-        # For now, return None and use text indicators
-        return None
+        icon = self._icon_cache.get("folder")
+        if icon is None:
+            icon = self._icon_provider.icon(QFileIconProvider.IconType.Folder)
+            self._icon_cache["folder"] = icon
+        return icon
 
     def _get_file_icon(self, file_type: str) -> QIcon:
-        """Get file icon based on type."""
-        # In a real implementation, you'd have different icons for different file types
-        return None
+        """Get file icon based on type, cached per type."""
+        cache_key = f"file:{file_type}"
+        icon = self._icon_cache.get(cache_key)
+        if icon is None:
+            # Ask the provider for the icon of a representative file name
+            extension = next((ext for ext, type_name in _FILE_TYPE_MAP.items()
+                              if type_name == file_type), "")
+            if extension:
+                icon = self._icon_provider.icon(QFileInfo(f"file{extension}"))
+            if icon is None or icon.isNull():
+                icon = self._icon_provider.icon(QFileIconProvider.IconType.File)
+            self._icon_cache[cache_key] = icon
+        return icon
 
     def _filter_items(self, search_text: str):
         """Filter tree items based on search text."""
         search_text = search_text.lower()
+        self._filter_text = search_text
+
+        # Empty search just reveals everything, keeping expansion state
+        if not search_text:
+            iterator = QTreeWidgetItemIterator(self.tree)
+            while iterator.value():
+                iterator.value().setHidden(False)
+                iterator += 1
+            return
 
-        def filter_recursive(item: QTreeWidgetItem):
-            """Recursively filter items."""
-            item_text = item.text(0).lower()
-            match = search_text in item_text
-
-            # Check children
-            child_match = False
-            for i in range(item.childCount()):
-                child = item.child(i)
-                if filter_recursive(child):
-                    child_match = True
-
-            # Show item if it matches or has matching children
-            show_item = match or child_match or not search_text
-            item.setHidden(not show_item)
+        # Collect items in pre-order so that reversing visits children first
+        items = []
+        iterator = QTreeWidgetItemIterator(self.tree)
+        while iterator.value():
+            items.append(iterator.value())
+            iterator += 1
+
+        # Propagate matches bottom-up, keyed by item identity
+        has_visible_child = set()
+        visibility = []
+        to_expand = []
+        for item in reversed(items):
+            item_text = item.data(0, SEARCH_TEXT_ROLE)
+            if item_text is None:
+                # Items not created through add_item get cached on first search
+                item_text = item.text(0).lower()
+                item.setData(0, SEARCH_TEXT_ROLE, item_text)
+
+            # Placeholders never match, so filtering never triggers a lazy load
+            child_match = id(item) in has_visible_child
+            show_item = child_match or (search_text in item_text
+                                        and not self._is_placeholder(item))
+            visibility.append((item, show_item))
+
+            if show_item:
+                parent = item.parent()
+                if parent is not None:
+                    has_visible_child.add(id(parent))
 
             # Expand if has matching children
-            if child_match and search_text:
-                item.setExpanded(True)
-
-            return show_item
-
-        # Filter all top-level items
-        for i in range(self.tree.topLevelItemCount()):
-            item = self.tree.topLevelItem(i)
-            filter_recursive(item)
+            if child_match:
+                to_expand.append(item)
+
+        # Collapse first so hiding rows doesn't relayout an expanded tree,
+        # then expand only the branches leading to matches
+        self.tree.setUpdatesEnabled(False)
+        try:
+            self.tree.collapseAll()
+            for item, show_item in visibility:
+                item.setHidden(not show_item)
+            for item in to_expand:
+                self.tree.expandItem(item)
+        finally:
+            self.tree.setUpdatesEnabled(True)
+
+    def _is_placeholder(self, item: QTreeWidgetItem) -> bool:
+        """Check whether item is a lazy-load placeholder rather than content."""
+        return False
+
+    def _filter_new_items(self, items: list):
+        """Apply the current filter to items added after it ran."""
+        if not self._filter_text:
+            return
+        for item in items:
+            item.setHidden(self._filter_text not in item.data(0, SEARCH_TEXT_ROLE))
 
     def _clear_search(self):
         """Clear search and show all items."""
         self.search_input.clear()
+        self._search_timer.stop()
+        self._filter_items("")
 
     def _show_context_menu(self, position):
         """Show context menu for tree items."""
@@ -207,52 +392,73 @@ class TreeViewWidget(QWidget):
         if not item:
             return
 
+        if self._context_menu is None:
+            self._create_context_menu()
+
+        # Custom actions based on item type
+        is_folder = item.childCount() > 0
+        self._add_folder_action.setVisible(is_folder)
+        self._add_file_action.setVisible(is_folder)
+        self._rename_action.setVisible(not is_folder)
+
+        self._context_target = item
+        try:
+            self._context_menu.exec(self.tree.mapToGlobal(position))
+        finally:
+            self._context_target = None
+
+    def _create_context_menu(self):
+        """Create the context menu once; actions act on the current target."""
         menu = QMenu(self)
 
-        # Common actions
-        expand_action = QAction("Expand All", self)
-        expand_action.triggered.connect(lambda: self._expand_all(item))
-        menu.addAction(expand_action)
+        def add_action(text: str, handler) -> QAction:
+            action = QAction(text, self)
+            action.triggered.connect(lambda: handler(self._context_target))
+            menu.addAction(action)
+            return action
 
-        collapse_action = QAction("Collapse All", self)
-        collapse_action.triggered.connect(lambda: self._collapse_all(item))
-        menu.addAction(collapse_action)
+        # Common actions
+        add_action("Expand All", self._expand_all)
+        add_action("Collapse All", self._collapse_all)
 
         menu.addSeparator()
 
-        # Custom actions based on item type
-        if item.childCount() > 0:  # Folder
-            add_folder_action = QAction("Add Folder", self)
-            add_folder_action.triggered.connect(lambda: self._add_new_folder(item))
-            menu.addAction(add_folder_action)
-
-            add_file_action = QAction("Add File", self)
-            add_file_action.triggered.connect(lambda: self._add_new_file(item))
-            menu.addAction(add_file_action)
-        else:  # File
-            rename_action = QAction("Rename", self)
-            rename_action.triggered.connect(lambda: self._rename_item(item))
-            menu.addAction(rename_action)
+        # Folder / file specific actions, toggled per item
+        self._add_folder_action = add_action("Add Folder", self._add_new_folder)
+        self._add_file_action = add_action("Add File", self._add_new_file)
+        self._rename_action = add_action("Rename", self._rename_item)
 
         menu.addSeparator()
 
-        delete_action = QAction("Delete", self)
-        delete_action.triggered.connect(lambda: self._delete_item(item))
-        menu.addAction(delete_action)
+        add_action("Delete", self._delete_item)
 
-        menu.exec(self.tree.mapToGlobal(position))
+        self._context_menu = menu
 
     def _expand_all(self, item: QTreeWidgetItem):
         """Expand item and all children."""
-        item.setExpanded(True)
-        for i in range(item.childCount()):
-            self._expand_all(item.child(i))
+        self.tree.expandRecursively(self.tree.indexFromItem(item))
 
     def _collapse_all(self, item: QTreeWidgetItem):
         """Collapse item and all children."""
-        item.setExpanded(False)
-        for i in range(item.childCount()):
-            self._collapse_all(item.child(i))
+        if item.parent() is None and self.tree.topLevelItemCount() == 1:
+            self.tree.collapseAll()
+            return
+
+        # Qt has no collapseRecursively, so collect expanded nodes in one sweep
+        expanded = []
+        stack = [item]
+        while stack:
+            current = stack.pop()
+            if current.isExpanded():
+                expanded.append(current)
+            stack.extend(current.child(i) for i in range(current.childCount()))
+
+        self.tree.setUpdatesEnabled(False)
+        try:
+            for current in expanded:
+                current.setExpanded(False)
+        finally:
+            self.tree.setUpdatesEnabled(True)
 
     def _add_new_folder(self, parent: QTreeWidgetItem):
         """Add new folder to parent."""
@@ -287,15 +493,14 @@ class TreeViewWidget(QWidget):
     def get_checked_items(self) -> list:
         """Get list of checked items."""
         checked_items = []
-
-        def collect_checked(item: QTreeWidgetItem):
+        iterator = QTreeWidgetItemIterator(
+            self.tree, QTreeWidgetItemIterator.IteratorFlag.Checked)
+        while iterator.value():
+            # The Checked flag only skips unchecked items; leave out partial ones
+            item = iterator.value()
             if item.checkState(0) == Qt.CheckState.Checked:
                 checked_items.append(item)
-            for i in range(item.childCount()):
-                collect_checked(item.child(i))
-
-        for i in range(self.tree.topLevelItemCount()):
-            collect_checked(self.tree.topLevelItem(i))
+            iterator += 1
 
         return checked_items
 
@@ -312,73 +517,230 @@ class TreeViewWidget(QWidget):
         self.tree.collapseAll()
 
 
+class _DirectoryScanThread(QThread):
+    """Lists a directory off the GUI thread, emitting entries in batches."""
+
+    batch_ready = pyqtSignal(str, list)  # path, [(name, entry_path, is_dir), ...]
+
+    BATCH_SIZE = 500
+
+    def __init__(self, path: str, parent=None):
+        super().__init__(parent)
+        self.path = path
+
+    def run(self):
+        """Scan the directory and emit its sorted entries."""
+        try:
+            with os.scandir(self.path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except PermissionError:
+            return  # Skip directories we can't access
+
+        batch = []
+        for entry in entries:
+            if self.isInterruptionRequested():
+                return
+            batch.append((entry.name, entry.path, entry.is_dir()))
+            if len(batch) >= self.BATCH_SIZE:
+                self.batch_ready.emit(self.path, batch)
+                batch = []
+
+        if batch:
+            self.batch_ready.emit(self.path, batch)
+
+
+def _stop_scan_threads(scan_threads: dict, *args):
+    """Interrupt directory scans and wait for their threads to exit."""
+    for thread, _ in scan_threads.values():
+        thread.requestInterruption()
+        thread.wait()
+    scan_threads.clear()
+
+
 class FileTreeView(TreeViewWidget):
-    """Tree view specifically for file system navigation."""
+    """Tree view specifically for file system navigation.
+
+    With threaded=True directories are listed on a worker thread and their
+    entries are added in batches, keeping the UI responsive on large roots.
+    """
 
-    def __init__(self, root_path: str = "", parent=None):
+    PLACEHOLDER_TEXT = "Loading..."
+
+    def __init__(self, root_path: str = "", parent=None, threaded: bool = False):
         super().__init__(parent)
         self._root_path = root_path
+        self._threaded = threaded
+        self._scan_threads = {}  # path -> (scan thread, folder item)
+        self.tree.itemExpanded.connect(self._on_item_expanded)
+
+        # Scan threads are children of the view; stop them before they are
+        # deleted with it (the slot holds the dict, not the dying view)
+        self.destroyed.connect(partial(_stop_scan_threads, self._scan_threads))
         if root_path:
             self._load_file_system()
 
     def _load_file_system(self):
         """Load file system structure."""
-        import os
-
         if not os.path.exists(self._root_path):
             return
 
-        def add_path(path: str, parent_item=None):
-            """Recursively add paths to tree."""
-            try:
-                items = os.listdir(path)
-                items.sort()
-
-                for item_name in items:
-                    item_path = os.path.join(path, item_name)
-
-                    if os.path.isdir(item_path):
-                        folder_item = self.add_folder(item_name, parent_item)
-                        folder_item.setData(0, Qt.ItemDataRole.UserRole, item_path)
-                        # Lazy load - add placeholder
-                        placeholder = QTreeWidgetItem(folder_item, ["Loading..."])
-
-                    else:
-                        file_ext = os.path.splitext(item_name)[1].lower()
-                        file_type = self._get_file_type(file_ext)
-                        file_item = self.add_file(item_name, parent_item, file_type)
-                        file_item.setData(0, Qt.ItemDataRole.UserRole, item_path)
-
-            except PermissionError:
-                pass  # Skip directories we can't access
-
-        # Add root
-        root_name = os.path.basename(self._root_path) or self._root_path
-        root_item = self.add_folder(root_name)
-        root_item.setData(0, Qt.ItemDataRole.UserRole, self._root_path)
-        add_path(self._root_path, root_item)
-        root_item.setExpanded(True)
+        # Suspend painting, sorting and signals while populating
+        updates_enabled = self.tree.updatesEnabled()
+        sorting_enabled = self.tree.isSortingEnabled()
+        signals_blocked = self.tree.blockSignals(True)
+        self.tree.setUpdatesEnabled(False)
+        self.tree.setSortingEnabled(False)
+        try:
+            # Add root
+            root_name = os.path.basename(self._root_path) or self._root_path
+            root_item = self.add_folder(root_name)
+            root_item.setData(0, Qt.ItemDataRole.UserRole, self._root_path)
+            if self._threaded:
+                QTreeWidgetItem(root_item, [self.PLACEHOLDER_TEXT])
+                self._start_scan(self._root_path, root_item)
+            else:
+                self._add_path(self._root_path, root_item)
+            root_item.setExpanded(True)
+        finally:
+            self.tree.setSortingEnabled(sorting_enabled)
+            self.tree.blockSignals(signals_blocked)
+            self.tree.setUpdatesEnabled(updates_enabled)
+
+    def _add_path(self, path: str, parent_item: QTreeWidgetItem):
+        """Add the direct children of path; subfolders load on expand."""
+        try:
+            # scandir entries cache their type, avoiding a stat() per entry
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+
+            # Build children detached and attach them in one call
+            children = [
+                self._create_entry_item(entry.name, entry.path, entry.is_dir())
+                for entry in entries
+            ]
+            parent_item.addChildren(children)
+            self._filter_new_items(children)
+
+        except PermissionError:
+            pass  # Skip directories we can't access
+
+    def _create_entry_item(self, name: str, path: str, is_dir: bool) -> QTreeWidgetItem:
+        """Create a detached item for a directory entry."""
+        if is_dir:
+            folder_item = self._create_item(name, self._get_folder_icon(), path)
+            # Lazy load - add placeholder
+            QTreeWidgetItem(folder_item, [self.PLACEHOLDER_TEXT])
+            return folder_item
+
+        file_ext = os.path.splitext(name)[1].lower()
+        file_type = self._get_file_type(file_ext)
+        return self._create_item(name, self._get_file_icon(file_type), path)
+
+    def _placeholder_child(self, item: QTreeWidgetItem):
+        """Get the lazy-load placeholder if it is the item's only child."""
+        if item.childCount() != 1:
+            return None
+
+        placeholder = item.child(0)
+        if (placeholder.text(0) != self.PLACEHOLDER_TEXT
+                or placeholder.data(0, Qt.ItemDataRole.UserRole) is not None):
+            return None
+        return placeholder
+
+    def _is_placeholder(self, item: QTreeWidgetItem) -> bool:
+        """Check whether item is a lazy-load placeholder rather than content."""
+        parent = item.parent()
+        return parent is not None and self._placeholder_child(parent) is item
+
+    def _on_item_expanded(self, item: QTreeWidgetItem):
+        """Replace a folder's placeholder with its contents on first expand."""
+        placeholder = self._placeholder_child(item)
+        if placeholder is None:
+            return
+
+        path = item.data(0, Qt.ItemDataRole.UserRole)
+        if not path:
+            return
+
+        if self._threaded:
+            # The placeholder stays until the first batch arrives
+            self._start_scan(path, item)
+            return
+
+        self.tree.setUpdatesEnabled(False)
+        try:
+            item.removeChild(placeholder)
+            self._add_path(path, item)
+        finally:
+            self.tree.setUpdatesEnabled(True)
+
+    def _start_scan(self, path: str, item: QTreeWidgetItem):
+        """List path on a worker thread, filling item as batches arrive."""
+        if path in self._scan_threads:
+            return
+
+        thread = _DirectoryScanThread(path, self)
+        thread.batch_ready.connect(self._on_batch_ready)
+        thread.finished.connect(self._on_scan_finished)
+        self._scan_threads[path] = (thread, item)
+        thread.start()
+
+    def _on_batch_ready(self, path: str, batch: list):
+        """Add a batch of scanned entries under their folder item."""
+        # Batches queued by a scan that clear_tree() already replaced are stale
+        scan = self._scan_threads.get(path)
+        if scan is None or scan[0] is not self.sender() or sip.isdeleted(scan[1]):
+            return
+
+        item = scan[1]
+        self.tree.setUpdatesEnabled(False)
+        try:
+            placeholder = self._placeholder_child(item)
+            if placeholder is not None:
+                item.removeChild(placeholder)
+            children = [self._create_entry_item(*entry) for entry in batch]
+            item.addChildren(children)
+            self._filter_new_items(children)
+        finally:
+            self.tree.setUpdatesEnabled(True)
+
+    def _on_scan_finished(self):
+        """Drop the finished scan, clearing the placeholder of empty folders."""
+        thread = self.sender()
+        thread.deleteLater()
+        scan = self._scan_threads.get(thread.path)
+        if scan is None or scan[0] is not thread:
+            return  # Dropped by clear_tree, possibly replaced by a new scan
+        del self._scan_threads[thread.path]
+
+        item = scan[1]
+        if not sip.isdeleted(item):
+            placeholder = self._placeholder_child(item)
+            if placeholder is not None:
+                item.removeChild(placeholder)
+
+    def _delete_item(self, item: QTreeWidgetItem):
+        """Delete tree item, stopping scans of the folders removed with it."""
+        removed = {}
+        for path, scan in self._scan_threads.items():
+            folder = scan[1]
+            while folder is not None and folder is not item:
+                folder = folder.parent()
+            if folder is item:
+                removed[path] = scan
+        for path in removed:
+            del self._scan_threads[path]
+        _stop_scan_threads(removed)
+        super()._delete_item(item)
+
+    def clear_tree(self):
+        """Clear all items, stopping any directory scans in progress."""
+        _stop_scan_threads(self._scan_threads)
+        super().clear_tree()
 
     def _get_file_type(self, extension: str) -> str:
         """Determine file type from extension."""
-        type_map = {
-            '.py': 'python',
-            '.js': 'javascript',
-            '.html': 'html',
-            '.css': 'css',
-            '.txt': 'text',
-            '.md': 'markdown',
-            '.json': 'json',
-            '.xml': 'xml',
-            '.png': 'image',
-            '.jpg': 'image',
-            '.jpeg': 'image',
-            '.gif': 'image',
-            '.pdf': 'pdf',
-            '.doc': 'document',
-            '.docx': 'document'
-        }
-        return type_map.get(extension, 'default')
+        return _FILE_TYPE_MAP.get(extension, 'default')
 
 
 class CheckableTreeView(TreeViewWidget):
@@ -393,41 +755,77 @@ class CheckableTreeView(TreeViewWidget):
 
     def _on_item_changed(self, item: QTreeWidgetItem, column: int):
         """Handle item check state change."""
-        if column == 0:  # Only handle first column
+        if column != 0:  # Only handle first column
+            return
+
+        # Ignore changes that leave the checked state alone (e.g. text edits)
+        is_checked = item.checkState(0) == Qt.CheckState.Checked
+        was_checked = bool(item.data(0, _WAS_CHECKED_ROLE))
+        if is_checked == was_checked:
+            return
+
+        # Cascaded check changes must not re-enter this handler
+        signals_blocked = self.tree.blockSignals(True)
+        try:
+            item.setData(0, _WAS_CHECKED_ROLE, is_checked)
             self._update_children_check_state(item)
-            self._update_parent_check_state(item)
-            self.items_checked.emit(self.get_checked_items())
+            self._update_parent_check_state(item, 1 if is_checked else -1)
+        finally:
+            self.tree.blockSignals(signals_blocked)
+        self.items_checked.emit(self.get_checked_items())
 
     def _update_children_check_state(self, item: QTreeWidgetItem):
         """Update children to match parent check state."""
         check_state = item.checkState(0)
-        for i in range(item.childCount()):
-            child = item.child(i)
-            child.setCheckState(0, check_state)
-            self._update_children_check_state(child)
-
-    def _update_parent_check_state(self, item: QTreeWidgetItem):
-        """Update parent check state based on children."""
+        is_checked = check_state == Qt.CheckState.Checked
+        queue = deque([item])
+        while queue:
+            current = queue.popleft()
+            child_count = current.childCount()
+            current.setData(0, _CHECKED_COUNT_ROLE, child_count if is_checked else 0)
+            for i in range(child_count):
+                child = current.child(i)
+                child.setCheckState(0, check_state)
+                child.setData(0, _WAS_CHECKED_ROLE, is_checked)
+                queue.append(child)
+
+    def _update_parent_check_state(self, item: QTreeWidgetItem, delta: int):
+        """Update ancestors from their running count of checked children.
+
+        delta is +1 or -1 as item became checked or unchecked. The walk stops
+        at the first ancestor whose own checked state does not change.
+        """
         parent = item.parent()
-        if not parent:
-            return
-
-        # Count checked children
-        checked_count = 0
-        total_count = parent.childCount()
+        while parent is not None and delta:
+            checked_count = parent.data(0, _CHECKED_COUNT_ROLE)
+            if checked_count is None:
+                # Count not tracked yet; the scan already includes this change
+                checked_count = sum(
+                    1 for i in range(parent.childCount())
+                    if parent.child(i).checkState(0) == Qt.CheckState.Checked)
+            else:
+                checked_count += delta
+            parent.setData(0, _CHECKED_COUNT_ROLE, checked_count)
+
+            # Set parent state
+            if checked_count == 0:
+                check_state = Qt.CheckState.Unchecked
+            elif checked_count == parent.childCount():
+                check_state = Qt.CheckState.Checked
+            else:
+                check_state = Qt.CheckState.PartiallyChecked
+
+            was_checked = parent.checkState(0) == Qt.CheckState.Checked
+            is_checked = check_state == Qt.CheckState.Checked
+            parent.setCheckState(0, check_state)
+            parent.setData(0, _WAS_CHECKED_ROLE, is_checked)
+
+            delta = int(is_checked) - int(was_checked)
+            parent = parent.parent()
 
-        for i in range(total_count):
-            child = parent.child(i)
-            if child.checkState(0) == Qt.CheckState.Checked:
-                checked_count += 1
-
-        # Set parent state
-        if checked_count == 0:
-            parent.setCheckState(0, Qt.CheckState.Unchecked)
-        elif checked_count == total_count:
-            parent.setCheckState(0, Qt.CheckState.Checked)
-        else:
-            parent.setCheckState(0, Qt.CheckState.PartiallyChecked)
-
-        # Recursively update grandparent
-        self._update_parent_check_state(parent)
\ No newline at end of file
+    def _delete_item(self, item: QTreeWidgetItem):
+        """Delete tree item and drop the parent's cached checked count."""
+        parent = item.parent()
+        super()._delete_item(item)
+        if parent is not None:
+            parent.setData(0, _CHECKED_COUNT_ROLE, None)
@@ -3,16 +3,28 @@ Comprehensive showcase of all card widgets.
 """
 
 import sys
-from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, QScrollArea, QGridLayout
+from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, QScrollArea, QGridLayout, QLabel
 from PyQt6.QtCore import Qt
 
 from ..cards import (
     InfoCardWidget, ProfileCardWidget, StatCardWidget, ExpandableCardWidget,
     HoverActionCardWidget, ImageCardWidget, SelectableCardWidget
 )
+from ..cards.info_card import MetricInfoCard
+from ..cards.profile_card import CompactProfileCard, TeamMemberCard
+from ..cards.stat_card import ProgressStatCard
 from ..base.theme_manager import theme_manager
 
 
+def _detached_grid():
+    """Create an unparented holder with a margin-free grid, updates suspended."""
+    holder = QWidget()
+    holder.setUpdatesEnabled(False)
+    grid = QGridLayout(holder)
+    grid.setContentsMargins(0, 0, 0, 0)
+    return holder, grid
+
+
 class CardShowcaseWindow(QMainWindow):
     """Showcase window for all card widgets."""
 
@@ -25,29 +37,34 @@ class CardShowcaseWindow(QMainWindow):
 
     def _setup_ui(self):
         """Setup the showcase UI."""
-        # Central widget with scroll area
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-
-        # Main content widget
-        content_widget = QWidget()
-        main_layout = QVBoxLayout(content_widget)
-        main_layout.setSpacing(30)
-        main_layout.setContentsMargins(20, 20, 20, 20)
-
-        # Add card sections
-        self._add_info_cards(main_layout)
-        self._add_profile_cards(main_layout)
-        self._add_stat_cards(main_layout)
-        self._add_interactive_cards(main_layout)
-
-        scroll_area.setWidget(content_widget)
-        self.setCentralWidget(scroll_area)
+        # Defer painting until every card is built, then lay out once
+        self.setUpdatesEnabled(False)
+        try:
+            # Central widget with scroll area
+            scroll_area = QScrollArea()
+            scroll_area.setWidgetResizable(True)
+
+            # Main content widget
+            content_widget = QWidget()
+            content_widget.setUpdatesEnabled(False)
+            main_layout = QVBoxLayout(content_widget)
+            main_layout.setSpacing(30)
+            main_layout.setContentsMargins(20, 20, 20, 20)
+
+            # Add card sections
+            self._add_info_cards(main_layout)
+            self._add_profile_cards(main_layout)
+            self._add_stat_cards(main_layout)
+            self._add_interactive_cards(main_layout)
+            content_widget.setUpdatesEnabled(True)
+
+            scroll_area.setWidget(content_widget)
+            self.setCentralWidget(scroll_area)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _add_info_cards(self, layout):
         """Add info card examples."""
-        from PyQt6.QtWidgets import QLabel
-
         # Section title
         title = QLabel("Info Cards")
         title.setStyleSheet(f"""
@@ -60,8 +77,8 @@ class CardShowcaseWindow(QMainWindow):
         """)
         layout.addWidget(title)
 
-        # Cards grid
-        cards_layout = QGridLayout()
+        # Cards grid, populated in a detached holder and attached once
+        grid_holder, cards_layout = _detached_grid()
 
         # Basic info card
         basic_card = InfoCardWidget(
@@ -81,7 +98,6 @@ class CardShowcaseWindow(QMainWindow):
         cards_layout.addWidget(icon_card, 0, 1)
 
         # Metric info card
-        from ..cards.info_card import MetricInfoCard
         metric_card = MetricInfoCard(
             title="Revenue",
             value="$45,231",
@@ -90,12 +106,11 @@ class CardShowcaseWindow(QMainWindow):
         )
         cards_layout.addWidget(metric_card, 0, 2)
 
-        layout.addLayout(cards_layout)
+        grid_holder.setUpdatesEnabled(True)
+        layout.addWidget(grid_holder)
 
     def _add_profile_cards(self, layout):
         """Add profile card examples."""
-        from PyQt6.QtWidgets import QLabel
-
         # Section title
         title = QLabel("Profile Cards")
         title.setStyleSheet(f"""
@@ -108,8 +123,8 @@ class CardShowcaseWindow(QMainWindow):
         """)
         layout.addWidget(title)
 
-        # Cards grid
-        cards_layout = QGridLayout()
+        # Cards grid, populated in a detached holder and attached once
+        grid_holder, cards_layout = _detached_grid()
 
         # Standard profile card
         profile_card = ProfileCardWidget(
@@ -122,7 +137,6 @@ class CardShowcaseWindow(QMainWindow):
         cards_layout.addWidget(profile_card, 0, 0)
 
         # Compact profile card
-        from ..cards.profile_card import CompactProfileCard
         compact_card = CompactProfileCard(
             name="Bob Smith",
             role="Developer"
@@ -130,7 +144,6 @@ class CardShowcaseWindow(QMainWindow):
         cards_layout.addWidget(compact_card, 0, 1)
 
         # Team member card with status
-        from ..cards.profile_card import TeamMemberCard
         team_card = TeamMemberCard(
             name="Carol Davis",
             role="Project Manager",
@@ -138,12 +151,11 @@ class CardShowcaseWindow(QMainWindow):
         )
         cards_layout.addWidget(team_card, 0, 2)
 
-        layout.addLayout(cards_layout)
+        grid_holder.setUpdatesEnabled(True)
+        layout.addWidget(grid_holder)
 
     def _add_stat_cards(self, layout):
         """Add statistics card examples."""
-        from PyQt6.QtWidgets import QLabel
-
         # Section title
         title = QLabel("Statistics Cards")
         title.setStyleSheet(f"""
@@ -156,8 +168,8 @@ class CardShowcaseWindow(QMainWindow):
         """)
         layout.addWidget(title)
 
-        # Cards grid
-        cards_layout = QGridLayout()
+        # Cards grid, populated in a detached holder and attached once
+        grid_holder, cards_layout = _detached_grid()
 
         # Basic stat card
         users_card = StatCardWidget(
@@ -179,7 +191,6 @@ class CardShowcaseWindow(QMainWindow):
         cards_layout.addWidget(revenue_card, 0, 1)
 
         # Progress stat card
-        from ..cards.stat_card import ProgressStatCard
         progress_card = ProgressStatCard(
             label="Project Progress",
             value="75",
@@ -188,12 +199,11 @@ class CardShowcaseWindow(QMainWindow):
         )
         cards_layout.addWidget(progress_card, 0, 2)
 
-        layout.addLayout(cards_layout)
+        grid_holder.setUpdatesEnabled(True)
+        layout.addWidget(grid_holder)
 
     def _add_interactive_cards(self, layout):
         """Add interactive card examples."""
-        from PyQt6.QtWidgets import QLabel
-
         # Section title
         title = QLabel("Interactive Cards")
         title.setStyleSheet(f"""
@@ -206,16 +216,15 @@ class CardShowcaseWindow(QMainWindow):
         """)
         layout.addWidget(title)
 
-        # Cards grid
-        cards_layout = QGridLayout()
+        # Cards grid, populated in a detached holder and attached once
+        grid_holder, cards_layout = _detached_grid()
 
         # Expandable card
         expandable_card = ExpandableCardWidget(
             title="Expandable Content",
             expanded=False
         )
-        from PyQt6.QtWidgets import QLabel as ContentLabel
-        content_label = ContentLabel("This is the expandable content that can be shown or hidden.")
+        content_label = QLabel("This is the expandable content that can be shown or hidden.")
         content_label.setWordWrap(True)
         expandable_card.set_content(content_label)
         cards_layout.addWidget(expandable_card, 0, 0)
@@ -238,7 +247,8 @@ class CardShowcaseWindow(QMainWindow):
         )
         cards_layout.addWidget(selectable_card, 0, 2)
 
-        layout.addLayout(cards_layout)
+        grid_holder.setUpdatesEnabled(True)
+        layout.addWidget(grid_holder)
 
 
 def run_card_showcase():
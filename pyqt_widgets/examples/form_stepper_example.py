@@ -2,16 +2,20 @@
 Example usage of FormStepperWidget.
 """
 
+import logging
+import os
 import sys
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QWidget,
                              QLabel, QLineEdit, QTextEdit, QCheckBox, QComboBox,
                              QPushButton, QFormLayout, QHBoxLayout)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QStringListModel
 
-# Add the parent directory to the path to import the widgets
-sys.path.append('..')
+from ..forms.form_stepper import FormStepperWidget, SimpleFormStepper
 
-from forms.form_stepper import FormStepperWidget, SimpleFormStepper
+log = logging.getLogger(__name__)
+
+_COUNTRIES = ("USA", "Canada", "UK", "Australia", "Germany")
+_SIMPLE_STEP_TITLES = ("Personal Info", "Contact Details", "Preferences", "Review")
 
 
 class FormStepperExample(QMainWindow):
@@ -22,6 +26,10 @@ class FormStepperExample(QMainWindow):
         self.setWindowTitle("Form Stepper Example")
         self.setGeometry(100, 100, 800, 600)
 
+        self._review_dirty = True
+        self._last_review_signature = None
+        self._last_review_text = None
+
         # Central widget
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -30,20 +38,43 @@ class FormStepperExample(QMainWindow):
 
         # Form stepper
         self.stepper = FormStepperWidget()
-        self.stepper.step_changed.connect(self.on_step_changed)
+        self.stepper.step_changed.connect(self.on_step_changed,
+                                         Qt.ConnectionType.DirectConnection)
         self.stepper.step_completed.connect(self.on_step_completed)
         self.stepper.form_completed.connect(self.on_form_completed)
 
-        # Add steps
-        self.create_steps()
+        # Add steps with the stepper's painting deferred until all are in
+        self.stepper.setUpdatesEnabled(False)
+        try:
+            self.create_steps()
+        finally:
+            self.stepper.setUpdatesEnabled(True)
+
+        # Step data builders, keyed by step index
+        self._data_builders = {
+            0: lambda: {
+                'first_name': self.first_name.text(),
+                'last_name': self.last_name.text(),
+                'email': self.email.text()
+            },
+            1: lambda: {
+                'phone': self.phone.text(),
+                'address': self.address.toPlainText(),
+                'country': self.country.currentText()
+            },
+            2: lambda: {
+                'newsletter': self.newsletter.isChecked(),
+                'notifications': self.notifications.isChecked(),
+                'marketing': self.marketing.isChecked()
+            },
+        }
 
         layout.addWidget(self.stepper)
 
         # Simple stepper example
         layout.addWidget(QLabel("Simple Stepper:"))
 
-        step_titles = ["Personal Info", "Contact Details", "Preferences", "Review"]
-        self.simple_stepper = SimpleFormStepper(step_titles)
+        self.simple_stepper = SimpleFormStepper(_SIMPLE_STEP_TITLES)
         self.simple_stepper.step_changed.connect(self.on_simple_step_changed)
         layout.addWidget(self.simple_stepper)
 
@@ -76,7 +107,7 @@ class FormStepperExample(QMainWindow):
         self.address = QTextEdit()
         self.address.setMaximumHeight(100)
         self.country = QComboBox()
-        self.country.addItems(["USA", "Canada", "UK", "Australia", "Germany"])
+        self.country.setModel(QStringListModel(list(_COUNTRIES), self.country))
 
         step2_layout.addRow("Phone:", self.phone)
         step2_layout.addRow("Address:", self.address)
@@ -129,99 +160,101 @@ class FormStepperExample(QMainWindow):
 
     def validate_step1(self) -> bool:
         """Validate step 1."""
-        if not self.first_name.text().strip():
-            print("First name is required")
+        first_name = self.first_name.text().strip()
+        last_name = self.last_name.text().strip()
+        email = self.email.text().strip()
+
+        if not first_name:
+            log.info("First name is required")
             return False
-        if not self.last_name.text().strip():
-            print("Last name is required")
+        if not last_name:
+            log.info("Last name is required")
             return False
-        if not self.email.text().strip() or "@" not in self.email.text():
-            print("Valid email is required")
+        if not email or "@" not in email:
+            log.info("Valid email is required")
             return False
         return True
 
     def validate_step2(self) -> bool:
         """Validate step 2."""
         if not self.phone.text().strip():
-            print("Phone number is required")
+            log.info("Phone number is required")
             return False
         if not self.address.toPlainText().strip():
-            print("Address is required")
+            log.info("Address is required")
             return False
         return True
 
     def on_step_changed(self, step_index):
         """Handle step change."""
-        print(f"Step changed to: {step_index}")
+        log.debug("Step changed to: %s", step_index)
 
-        # Update review when reaching final step
-        if step_index == 3:  # Review step
+        # Update review when reaching final step with new step data
+        if step_index == 3 and self._review_dirty:  # Review step
             self.update_review()
+            self._review_dirty = False
 
     def on_step_completed(self, step_index):
         """Handle step completion."""
-        print(f"Step {step_index} completed")
+        log.debug("Step %s completed", step_index)
 
         # Store step data
-        if step_index == 0:
-            self.stepper.set_step_data(step_index, {
-                'first_name': self.first_name.text(),
-                'last_name': self.last_name.text(),
-                'email': self.email.text()
-            })
-        elif step_index == 1:
-            self.stepper.set_step_data(step_index, {
-                'phone': self.phone.text(),
-                'address': self.address.toPlainText(),
-                'country': self.country.currentText()
-            })
-        elif step_index == 2:
-            self.stepper.set_step_data(step_index, {
-                'newsletter': self.newsletter.isChecked(),
-                'notifications': self.notifications.isChecked(),
-                'marketing': self.marketing.isChecked()
-            })
+        builder = self._data_builders.get(step_index)
+        if builder:
+            self.stepper.set_step_data(step_index, builder())
+            self._review_dirty = True
 
     def on_form_completed(self, all_data):
         """Handle form completion."""
-        print("Form completed!")
-        print("All data:", all_data)
+        log.info("Form completed!")
+        log.info("All data: %s", all_data)
 
     def update_review(self):
         """Update review information."""
-        review_text = "Review Information:\n\n"
+        step0_data = self.stepper.get_step_data(0)
+        step1_data = self.stepper.get_step_data(1)
+        step2_data = self.stepper.get_step_data(2)
+
+        # Skip formatting entirely when no step data changed
+        signature = repr((step0_data, step1_data, step2_data))
+        if signature == self._last_review_signature:
+            return
+        self._last_review_signature = signature
+
+        parts = ["Review Information:\n\n"]
 
         # Personal info
-        step0_data = self.stepper.get_step_data(0)
         if step0_data:
-            review_text += "Personal Information:\n"
-            review_text += f"Name: {step0_data.get('first_name', '')} {step0_data.get('last_name', '')}\n"
-            review_text += f"Email: {step0_data.get('email', '')}\n\n"
+            parts.append("Personal Information:\n")
+            parts.append(f"Name: {step0_data.get('first_name', '')} {step0_data.get('last_name', '')}\n")
+            parts.append(f"Email: {step0_data.get('email', '')}\n\n")
 
         # Contact info
-        step1_data = self.stepper.get_step_data(1)
         if step1_data:
-            review_text += "Contact Details:\n"
-            review_text += f"Phone: {step1_data.get('phone', '')}\n"
-            review_text += f"Country: {step1_data.get('country', '')}\n"
-            review_text += f"Address: {step1_data.get('address', '')}\n\n"
+            parts.append("Contact Details:\n")
+            parts.append(f"Phone: {step1_data.get('phone', '')}\n")
+            parts.append(f"Country: {step1_data.get('country', '')}\n")
+            parts.append(f"Address: {step1_data.get('address', '')}\n\n")
 
         # Preferences
-        step2_data = self.stepper.get_step_data(2)
         if step2_data:
-            review_text += "Preferences:\n"
-            review_text += f"Newsletter: {'Yes' if step2_data.get('newsletter') else 'No'}\n"
-            review_text += f"Notifications: {'Yes' if step2_data.get('notifications') else 'No'}\n"
-            review_text += f"Marketing: {'Yes' if step2_data.get('marketing') else 'No'}\n"
+            parts.append("Preferences:\n")
+            parts.append(f"Newsletter: {'Yes' if step2_data.get('newsletter') else 'No'}\n")
+            parts.append(f"Notifications: {'Yes' if step2_data.get('notifications') else 'No'}\n")
+            parts.append(f"Marketing: {'Yes' if step2_data.get('marketing') else 'No'}\n")
 
-        self.review_label.setText(review_text)
+        review_text = "".join(parts)
+        if review_text != self._last_review_text:
+            self._last_review_text = review_text
+            self.review_label.setText(review_text)
 
     def on_simple_step_changed(self, step_index):
         """Handle simple stepper step change."""
-        print(f"Simple stepper step: {step_index}")
+        log.debug("Simple stepper step: %s", step_index)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO"))
     app = QApplication(sys.argv)
 
     window = FormStepperExample()
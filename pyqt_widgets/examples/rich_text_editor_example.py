@@ -2,14 +2,30 @@
 Example usage of RichTextEditorWidget.
 """
 
+import logging
+import os
 import sys
 from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QPushButton, QHBoxLayout
-from PyQt6.QtCore import Qt
-
-# Add the parent directory to the path to import the widgets
-sys.path.append('..')
-
-from forms.rich_text_editor import RichTextEditorWidget, SimpleRichTextEditor
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QTextCursor, QTextDocumentFragment
+
+from ..forms.rich_text_editor import RichTextEditorWidget, SimpleRichTextEditor
+
+log = logging.getLogger(__name__)
+
+_SAMPLE_HTML = """
+<h1>Sample Rich Text Content</h1>
+<p>This is a <b>bold</b> paragraph with <i>italic</i> and <u>underlined</u> text.</p>
+<p style="color: red;">This text is red.</p>
+<ul>
+    <li>First bullet point</li>
+    <li>Second bullet point</li>
+</ul>
+<ol>
+    <li>First numbered item</li>
+    <li>Second numbered item</li>
+</ol>
+"""
 
 
 class RichTextEditorExample(QMainWindow):
@@ -26,9 +42,19 @@ class RichTextEditorExample(QMainWindow):
 
         layout = QVBoxLayout(central_widget)
 
+        self._sample_fragment = None
+
+        # Content change probe, throttled to ~10 Hz
+        self._pending_html = None
+        self._content_timer = QTimer(self)
+        self._content_timer.setSingleShot(True)
+        self._content_timer.setInterval(100)
+        self._content_timer.timeout.connect(self._flush_content)
+
         # Rich text editor
         self.editor = RichTextEditorWidget()
-        self.editor.content_changed.connect(self.on_content_changed)
+        self.editor.content_changed.connect(self.on_content_changed,
+                                           Qt.ConnectionType.DirectConnection)
         layout.addWidget(self.editor)
 
         # Control buttons
@@ -62,24 +88,23 @@ class RichTextEditorExample(QMainWindow):
 
     def on_content_changed(self, html_content):
         """Handle content change."""
-        print(f"Content changed: {len(html_content)} characters")
+        self._pending_html = html_content
+        if not self._content_timer.isActive():
+            self._content_timer.start()
+
+    def _flush_content(self):
+        """Report the latest content change."""
+        log.debug("Content changed: %d characters", len(self._pending_html))
 
     def load_sample_content(self):
         """Load sample content."""
-        sample_html = """
-        <h1>Sample Rich Text Content</h1>
-        <p>This is a <b>bold</b> paragraph with <i>italic</i> and <u>underlined</u> text.</p>
-        <p style="color: red;">This text is red.</p>
-        <ul>
-            <li>First bullet point</li>
-            <li>Second bullet point</li>
-        </ul>
-        <ol>
-            <li>First numbered item</li>
-            <li>Second numbered item</li>
-        </ol>
-        """
-        self.editor.set_html(sample_html)
+        # Parse the sample HTML once; later clicks reuse the fragment
+        if self._sample_fragment is None:
+            self._sample_fragment = QTextDocumentFragment.fromHtml(_SAMPLE_HTML)
+
+        cursor = QTextCursor(self.editor.text_editor.document())
+        cursor.select(QTextCursor.SelectionType.Document)
+        cursor.insertFragment(self._sample_fragment)
 
     def show_html(self):
         """Show HTML content."""
@@ -94,6 +119,7 @@ class RichTextEditorExample(QMainWindow):
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO"))
     app = QApplication(sys.argv)
 
     window = RichTextEditorExample()
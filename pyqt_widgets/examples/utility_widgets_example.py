@@ -2,87 +2,178 @@
 Example usage of utility widgets.
 """
 
+import logging
+import os
+import re
 import sys
+from functools import lru_cache
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QWidget,
                              QPushButton, QHBoxLayout, QTabWidget, QLabel,
-                             QTextEdit, QSplitter)
-from PyQt6.QtCore import Qt
+                             QTextEdit, QPlainTextEdit, QSplitter)
+from PyQt6.QtCore import Qt, QTimer
 
-# Add the parent directory to the path to import the widgets
-sys.path.append('..')
+from ..utility.quick_settings_panel import QuickSettingsPanel
+from ..utility.pinned_note import NoteManager, PinnedNoteWidget
+from ..utility.clipboard_history import ClipboardHistoryWidget
+from ..utility.global_search import GlobalSearchWidget, file_search_provider, content_search_provider
+from ..utility.shortcut_helper import ShortcutHelperWidget
 
-from utility.quick_settings_panel import QuickSettingsPanel
-from utility.pinned_note import NoteManager, PinnedNoteWidget
-from utility.clipboard_history import ClipboardHistoryWidget
-from utility.global_search import GlobalSearchWidget, file_search_provider, content_search_provider
-from utility.shortcut_helper import ShortcutHelperWidget
+log = logging.getLogger(__name__)
+
+_LANGUAGES = ("English", "Spanish", "French", "German")
+
+_KEYWORD_RE = re.compile(r"test|example", re.IGNORECASE)
+_TEST_RESULT = {
+    'description': 'This is a custom search result from the example provider',
+    'type': 'custom',
+    'score': 90.0
+}
+_EXAMPLE_RESULT = {
+    'title': 'Example Custom Item',
+    'description': 'Another example result with different content',
+    'type': 'custom',
+    'score': 85.0
+}
+
+
+def _short(content, limit=50):
+    """Truncate content for log output, marking the cut with an ellipsis."""
+    return content if len(content) <= limit else f"{content[:limit]}…"
+
+
+def _throttled(slot, interval, parent):
+    """Wrap a slot so it runs at most once per interval.
+
+    The first call runs immediately; calls arriving within the interval are
+    collapsed into one trailing call with the latest arguments.
+    """
+    timer = QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setInterval(interval)
+    pending = []
+
+    def flush():
+        if pending:
+            args = pending.pop()
+            timer.start()
+            slot(*args)
+
+    def throttled(*args):
+        if timer.isActive():
+            pending[:] = [args]
+        else:
+            timer.start()
+            slot(*args)
+
+    timer.timeout.connect(flush)
+    return throttled
+
+
+@lru_cache(maxsize=128)
+def _custom_search_results(query, filters_key):
+    """Build the mock custom search results for a query (cached)."""
+    # One case-insensitive scan for both keywords
+    found = {match.lower() for match in _KEYWORD_RE.findall(query)}
+    results = []
+
+    if "test" in found:
+        results.append({
+            'title': f'Custom Test Result for "{query}"',
+            **_TEST_RESULT
+        })
+
+    if "example" in found:
+        results.append(_EXAMPLE_RESULT)
+
+    return tuple(results)
 
 
 class UtilityWidgetsExample(QMainWindow):
     """Example application for utility widgets."""
 
+    # (tab title, factory method) in display order
+    _TAB_SPECS = (
+        ("Settings Panel", "create_settings_tab"),
+        ("Pinned Notes", "create_notes_tab"),
+        ("Clipboard History", "create_clipboard_tab"),
+        ("Global Search", "create_search_tab"),
+        ("Shortcuts Helper", "create_shortcuts_tab"),
+    )
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Utility Widgets Example")
         self.setGeometry(100, 100, 1200, 800)
 
-        # Central widget with tabs
-        central_widget = QTabWidget()
-        self.setCentralWidget(central_widget)
+        # Central widget with tabs; each tab is built the first time it is shown
+        self.tab_widget = QTabWidget()
+        self.setCentralWidget(self.tab_widget)
 
-        # Settings panel tab
-        self.create_settings_tab(central_widget)
+        self._built_tabs = set()
 
-        # Notes tab
-        self.create_notes_tab(central_widget)
+        for title, _ in self._TAB_SPECS:
+            page = QWidget()
+            page_layout = QVBoxLayout(page)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            self.tab_widget.addTab(page, title)
 
-        # Clipboard history tab
-        self.create_clipboard_tab(central_widget)
+        self.tab_widget.currentChanged.connect(self._build_tab)
+        self._build_tab(self.tab_widget.currentIndex())
 
-        # Global search tab
-        self.create_search_tab(central_widget)
+    def _build_tab(self, index):
+        """Build the contents of a tab on first display."""
+        if index < 0 or index in self._built_tabs:
+            return
+        self._built_tabs.add(index)
 
-        # Shortcuts tab
-        self.create_shortcuts_tab(central_widget)
+        _, factory_name = self._TAB_SPECS[index]
+        self.tab_widget.widget(index).layout().addWidget(getattr(self, factory_name)())
 
-    def create_settings_tab(self, parent):
+    def create_settings_tab(self):
         """Create settings panel tab."""
         widget = QWidget()
         layout = QHBoxLayout(widget)
 
         # Settings panel
         self.settings_panel = QuickSettingsPanel("Application Settings")
-        self.settings_panel.setting_changed.connect(self.on_setting_changed)
+        self.settings_panel.setting_changed.connect(self.on_setting_changed,
+                                                   Qt.ConnectionType.DirectConnection)
         self.settings_panel.settings_applied.connect(self.on_settings_applied)
 
-        # Add various settings
-        self.settings_panel.add_toggle_setting(
-            "dark_mode", "Dark Mode", False, "Enable dark theme"
-        )
-        self.settings_panel.add_toggle_setting(
-            "auto_save", "Auto Save", True, "Automatically save changes"
-        )
-        self.settings_panel.add_choice_setting(
-            "language", "Language", ["English", "Spanish", "French", "German"], 0
-        )
-        self.settings_panel.add_number_setting(
-            "font_size", "Font Size", 12, 8, 24, "Application font size"
-        )
-        self.settings_panel.add_slider_setting(
-            "volume", "Volume", 75, 0, 100, "Audio volume level"
-        )
+        # Add various settings as one batch: a single layout pass, no emits
+        self.settings_panel.setUpdatesEnabled(False)
+        self.settings_panel.blockSignals(True)
+        try:
+            self.settings_panel.add_toggle_setting(
+                "dark_mode", "Dark Mode", False, "Enable dark theme"
+            )
+            self.settings_panel.add_toggle_setting(
+                "auto_save", "Auto Save", True, "Automatically save changes"
+            )
+            self.settings_panel.add_choice_setting(
+                "language", "Language", _LANGUAGES, 0
+            )
+            self.settings_panel.add_number_setting(
+                "font_size", "Font Size", 12, 8, 24, "Application font size"
+            )
+            self.settings_panel.add_slider_setting(
+                "volume", "Volume", 75, 0, 100, "Audio volume level"
+            )
+        finally:
+            self.settings_panel.blockSignals(False)
+            self.settings_panel.setUpdatesEnabled(True)
 
         layout.addWidget(self.settings_panel)
 
         # Settings output
-        self.settings_output = QTextEdit()
+        self.settings_output = QPlainTextEdit()
         self.settings_output.setReadOnly(True)
         self.settings_output.setMaximumWidth(300)
         layout.addWidget(self.settings_output)
 
-        parent.addTab(widget, "Settings Panel")
+        return widget
 
-    def create_notes_tab(self, parent):
+    def create_notes_tab(self):
         """Create notes tab."""
         widget = QWidget()
         layout = QVBoxLayout(widget)
@@ -92,17 +183,20 @@ class UtilityWidgetsExample(QMainWindow):
         self.note_manager.notes_changed.connect(self.on_notes_changed)
         layout.addWidget(self.note_manager)
 
-        parent.addTab(widget, "Pinned Notes")
+        return widget
 
-    def create_clipboard_tab(self, parent):
+    def create_clipboard_tab(self):
         """Create clipboard history tab."""
         widget = QWidget()
         layout = QHBoxLayout(widget)
 
         # Clipboard history
         self.clipboard_history = ClipboardHistoryWidget(max_items=20)
-        self.clipboard_history.item_selected.connect(self.on_clipboard_item_selected)
-        self.clipboard_history.item_copied.connect(self.on_clipboard_item_copied)
+        self.clipboard_history.item_selected.connect(
+            _throttled(self.on_clipboard_item_selected, 200, self))
+        self.clipboard_history.item_copied.connect(
+            _throttled(self.on_clipboard_item_copied, 200, self),
+            Qt.ConnectionType.DirectConnection)
         layout.addWidget(self.clipboard_history)
 
         # Test area
@@ -122,9 +216,9 @@ class UtilityWidgetsExample(QMainWindow):
 
         layout.addWidget(test_widget)
 
-        parent.addTab(widget, "Clipboard History")
+        return widget
 
-    def create_search_tab(self, parent):
+    def create_search_tab(self):
         """Create global search tab."""
         widget = QWidget()
         layout = QVBoxLayout(widget)
@@ -141,9 +235,9 @@ class UtilityWidgetsExample(QMainWindow):
 
         layout.addWidget(self.global_search)
 
-        parent.addTab(widget, "Global Search")
+        return widget
 
-    def create_shortcuts_tab(self, parent):
+    def create_shortcuts_tab(self):
         """Create shortcuts helper tab."""
         widget = QWidget()
         layout = QVBoxLayout(widget)
@@ -162,27 +256,27 @@ class UtilityWidgetsExample(QMainWindow):
 
         layout.addWidget(self.shortcuts_helper)
 
-        parent.addTab(widget, "Shortcuts Helper")
+        return widget
 
     def on_setting_changed(self, name, value):
         """Handle setting change."""
-        self.settings_output.append(f"Setting changed: {name} = {value}")
+        self.settings_output.appendPlainText(f"Setting changed: {name} = {value}")
 
     def on_settings_applied(self, all_settings):
         """Handle settings applied."""
-        self.settings_output.append(f"Settings applied: {all_settings}")
+        self.settings_output.appendPlainText(f"Settings applied: {all_settings}")
 
     def on_notes_changed(self, notes_data):
         """Handle notes change."""
-        print(f"Notes changed: {len(notes_data)} notes")
+        log.debug("Notes changed: %d notes", len(notes_data))
 
     def on_clipboard_item_selected(self, content):
         """Handle clipboard item selection."""
-        print(f"Clipboard item selected: {content[:50]}...")
+        log.debug("Clipboard item selected: %s", _short(content))
 
     def on_clipboard_item_copied(self, content):
         """Handle clipboard item copied."""
-        print(f"Clipboard item copied: {content[:50]}...")
+        log.debug("Clipboard item copied: %s", _short(content))
 
     def add_manual_clipboard_item(self):
         """Add manual clipboard item."""
@@ -192,41 +286,25 @@ class UtilityWidgetsExample(QMainWindow):
 
     def on_search_performed(self, query, filters):
         """Handle search performed."""
-        print(f"Search performed: '{query}' with filters: {filters}")
+        log.debug("Search performed: '%s' with filters: %s", query, filters)
 
     def on_search_result_selected(self, result):
         """Handle search result selected."""
-        print(f"Search result selected: {result}")
+        log.debug("Search result selected: %s", result)
 
     def custom_search_provider(self, query, filters):
         """Custom search provider."""
-        results = []
-
-        # Mock custom search results
-        if "test" in query.lower():
-            results.append({
-                'title': f'Custom Test Result for "{query}"',
-                'description': 'This is a custom search result from the example provider',
-                'type': 'custom',
-                'score': 90.0
-            })
-
-        if "example" in query.lower():
-            results.append({
-                'title': 'Example Custom Item',
-                'description': 'Another example result with different content',
-                'type': 'custom',
-                'score': 85.0
-            })
-
-        return results
+        filters_key = tuple(sorted(filters.items()))
+        # The search widget tags each result with its provider, so hand out copies
+        return [dict(result) for result in _custom_search_results(query, filters_key)]
 
     def on_shortcut_activated(self, shortcut_name):
         """Handle shortcut activation."""
-        print(f"Shortcut activated: {shortcut_name}")
+        log.debug("Shortcut activated: %s", shortcut_name)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO"))
     app = QApplication(sys.argv)
 
     window = UtilityWidgetsExample()
@@ -3,14 +3,73 @@ Badge label widget with count indicators.
 """
 
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QPropertyAnimation, QSequentialAnimationGroup
 from PyQt6.QtGui import QFont
 from ..base.theme_manager import theme_manager
 
+# Badge color name -> theme color key
+_BADGE_COLOR_KEYS = {
+    'primary': 'primary',
+    'success': 'success',
+    'warning': 'warning',
+    'error': 'danger',
+    'info': 'info',
+    'secondary': 'text_secondary'
+}
+
+# Badge width by count text length; longer texts get 8px per character
+_BADGE_SIZES = (18, 18, 22)
+
+# Status -> (badge color, status glyph)
+_STATUS_CONFIG = {
+    'online': ('success', '●'),
+    'offline': ('secondary', '●'),
+    'away': ('warning', '●'),
+    'busy': ('error', '●'),
+    'invisible': ('secondary', '○')
+}
+
+# Notification dots support every badge color except 'secondary'
+_DOT_COLOR_KEYS = {name: key for name, key in _BADGE_COLOR_KEYS.items()
+                   if name != 'secondary'}
+
+# Stylesheet templates
+_BADGE_QSS = """
+    QLabel {{
+        background-color: {bg};
+        color: {text};
+        border-radius: 9px;
+        font-size: 10px;
+        font-weight: bold;
+        padding: 2px 4px;
+    }}
+"""
+
+_STATUS_QSS = """
+    QLabel {{
+        background-color: transparent;
+        color: {color};
+        border-radius: 6px;
+        font-size: 12px;
+        font-weight: bold;
+    }}
+"""
+
+_DOT_QSS = """
+    QWidget {{
+        background-color: {color};
+        border-radius: {radius}px;
+        border: 2px solid white;
+    }}
+"""
+
 
 class BadgeLabel(QWidget):
     """Label with count badge indicator."""
 
+    # Badge stylesheets keyed by (badge color, theme), shared by all instances
+    _stylesheet_cache = {}
+
     def __init__(self, text="", count=0, badge_color="primary",
                  show_zero=False, max_count=99, parent=None):
         super().__init__(parent)
@@ -19,6 +78,7 @@ class BadgeLabel(QWidget):
         self._badge_color = badge_color
         self._show_zero = show_zero
         self._max_count = max_count
+        self._badge_state = None
         self._setup_ui()
 
     def _setup_ui(self):
@@ -53,26 +113,32 @@ class BadgeLabel(QWidget):
         # Determine if badge should be visible
         show_badge = self._count > 0 or (self._count == 0 and self._show_zero)
 
-        if not show_badge:
-            self.badge_label.hide()
-            return
-
         # Format count text
-        if self._count > self._max_count:
+        if not show_badge:
+            badge_text = None
+        elif self._count > self._max_count:
             badge_text = f"{self._max_count}+"
         else:
             badge_text = str(self._count)
 
+        # Nothing visible changed; leave the label (and its layout) alone
+        state = (badge_text, self._badge_color, theme_manager.get_current_theme())
+        if state == self._badge_state:
+            return
+        self._badge_state = state
+
+        if not show_badge:
+            self.badge_label.hide()
+            return
+
         self.badge_label.setText(badge_text)
 
         # Calculate badge size based on text length
         text_width = len(badge_text)
-        if text_width == 1:
-            badge_size = 18
-        elif text_width == 2:
-            badge_size = 22
+        if text_width < len(_BADGE_SIZES):
+            badge_size = _BADGE_SIZES[text_width]
         else:
-            badge_size = max(22, text_width * 8)
+            badge_size = text_width * 8
 
         self.badge_label.setFixedSize(badge_size, 18)
 
@@ -82,52 +148,27 @@ class BadgeLabel(QWidget):
             0
         )
 
-        # Apply badge styling
-        colors = self._get_badge_colors()
-
-        self.badge_label.setStyleSheet(f"""
-            QLabel {{
-                background-color: {colors['bg']};
-                color: {colors['text']};
-                border-radius: 9px;
-                font-size: 10px;
-                font-weight: bold;
-                padding: 2px 4px;
-            }}
-        """)
+        # Apply badge styling; Qt reparses on every setStyleSheet, so skip no-ops
+        stylesheet = self._get_badge_stylesheet()
+        if self.badge_label.styleSheet() != stylesheet:
+            self.badge_label.setStyleSheet(stylesheet)
 
         self.badge_label.show()
 
+    def _get_badge_stylesheet(self) -> str:
+        """Get the badge stylesheet, shared per (badge color, theme)."""
+        key = (self._badge_color, theme_manager.get_current_theme())
+        stylesheet = BadgeLabel._stylesheet_cache.get(key)
+        if stylesheet is None:
+            colors = self._get_badge_colors()
+            stylesheet = _BADGE_QSS.format(bg=colors['bg'], text=colors['text'])
+            BadgeLabel._stylesheet_cache[key] = stylesheet
+        return stylesheet
+
     def _get_badge_colors(self):
         """Get colors for badge based on badge_color."""
-        color_schemes = {
-            'primary': {
-                'bg': theme_manager.get_color('primary'),
-                'text': 'white'
-            },
-            'success': {
-                'bg': theme_manager.get_color('success'),
-                'text': 'white'
-            },
-            'warning': {
-                'bg': theme_manager.get_color('warning'),
-                'text': 'white'
-            },
-            'error': {
-                'bg': theme_manager.get_color('danger'),
-                'text': 'white'
-            },
-            'info': {
-                'bg': theme_manager.get_color('info'),
-                'text': 'white'
-            },
-            'secondary': {
-                'bg': theme_manager.get_color('text_secondary'),
-                'text': 'white'
-            }
-        }
-
-        return color_schemes.get(self._badge_color, color_schemes['primary'])
+        key = _BADGE_COLOR_KEYS.get(self._badge_color, 'primary')
+        return {'bg': theme_manager.get_color(key), 'text': 'white'}
 
     def set_text(self, text: str):
         """Update main text."""
@@ -178,8 +219,12 @@ class BadgeLabel(QWidget):
 class IconBadgeLabel(BadgeLabel):
     """Badge label with icon instead of text."""
 
+    # Icon fonts keyed by theme, shared by all instances
+    _icon_fonts = {}
+
     def __init__(self, icon=None, count=0, badge_color="primary", parent=None):
         self._icon = icon
+        self._icon_configured = False
         super().__init__("", count, badge_color, parent=parent)
         self._setup_icon()
 
@@ -189,15 +234,28 @@ class IconBadgeLabel(BadgeLabel):
             if isinstance(self._icon, str):
                 # Text icon (emoji or symbol)
                 self.text_label.setText(self._icon)
-                icon_font = theme_manager.get_font('default')
-                icon_font.setPointSize(16)
-                self.text_label.setFont(icon_font)
+                self.text_label.setFont(self._get_icon_font())
             else:
                 # QIcon or QPixmap
                 self.text_label.setPixmap(self._icon.pixmap(24, 24))
 
-        self.text_label.setFixedSize(24, 24)
-        self.text_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        # Size and alignment never change; set them once to avoid relayouts
+        if not self._icon_configured:
+            self.text_label.setFixedSize(24, 24)
+            self.text_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            self._icon_configured = True
+
+    @staticmethod
+    def _get_icon_font() -> QFont:
+        """Get the enlarged icon font, shared per theme."""
+        theme = theme_manager.get_current_theme()
+        font = IconBadgeLabel._icon_fonts.get(theme)
+        if font is None:
+            # Copy: the theme's font object is shared by every widget
+            font = QFont(theme_manager.get_font('default'))
+            font.setPointSize(16)
+            IconBadgeLabel._icon_fonts[theme] = font
+        return font
 
     def set_icon(self, icon):
         """Update icon."""
@@ -208,6 +266,9 @@ class IconBadgeLabel(BadgeLabel):
 class NotificationBadge(QWidget):
     """Simple notification dot badge."""
 
+    # Dot stylesheets keyed by (color, size, theme), shared by all instances
+    _stylesheet_cache = {}
+
     def __init__(self, color="primary", size=8, parent=None):
         super().__init__(parent)
         self._color = color
@@ -218,24 +279,17 @@ class NotificationBadge(QWidget):
     def _setup_ui(self):
         """Setup notification badge UI."""
         self.setFixedSize(self._size, self._size)
-
-        colors = {
-            'primary': theme_manager.get_color('primary'),
-            'success': theme_manager.get_color('success'),
-            'warning': theme_manager.get_color('warning'),
-            'error': theme_manager.get_color('danger'),
-            'info': theme_manager.get_color('info')
-        }
-
-        color = colors.get(self._color, colors['primary'])
-
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: {color};
-                border-radius: {self._size // 2}px;
-                border: 2px solid white;
-            }}
-        """)
+        self._apply_style()
+
+    def _apply_style(self):
+        """Apply the dot stylesheet for the current color and size."""
+        key = (self._color, self._size, theme_manager.get_current_theme())
+        stylesheet = NotificationBadge._stylesheet_cache.get(key)
+        if stylesheet is None:
+            color = theme_manager.get_color(_DOT_COLOR_KEYS.get(self._color, 'primary'))
+            stylesheet = _DOT_QSS.format(color=color, radius=self._size // 2)
+            NotificationBadge._stylesheet_cache[key] = stylesheet
+        self.setStyleSheet(stylesheet)
 
     def set_visible_badge(self, visible: bool):
         """Show/hide badge."""
@@ -245,7 +299,7 @@ class NotificationBadge(QWidget):
     def set_color(self, color: str):
         """Update badge color."""
         self._color = color
-        self._setup_ui()
+        self._apply_style()
 
     def is_visible_badge(self) -> bool:
         """Check if badge is visible."""
@@ -283,6 +337,9 @@ class MenuBadgeLabel(BadgeLabel):
 class StatusBadgeLabel(BadgeLabel):
     """Badge label that shows status instead of count."""
 
+    # Status stylesheets keyed by (badge color, theme), shared by all instances
+    _status_stylesheet_cache = {}
+
     def __init__(self, text="", status="offline", parent=None):
         self._status = status
         super().__init__(text, 0, "secondary", True, parent=parent)
@@ -290,17 +347,13 @@ class StatusBadgeLabel(BadgeLabel):
 
     def _update_status_badge(self):
         """Update badge to show status."""
-        status_config = {
-            'online': {'color': 'success', 'text': '●'},
-            'offline': {'color': 'secondary', 'text': '●'},
-            'away': {'color': 'warning', 'text': '●'},
-            'busy': {'color': 'error', 'text': '●'},
-            'invisible': {'color': 'secondary', 'text': '○'}
-        }
+        # The status display replaces the count badge state
+        self._badge_state = None
 
-        config = status_config.get(self._status, status_config['offline'])
+        self._badge_color, status_text = _STATUS_CONFIG.get(
+            self._status, _STATUS_CONFIG['offline'])
 
-        self.badge_label.setText(config['text'])
+        self.badge_label.setText(status_text)
         self.badge_label.setFixedSize(12, 12)
 
         # Position badge
@@ -310,23 +363,20 @@ class StatusBadgeLabel(BadgeLabel):
         )
 
         # Apply status-specific styling
-        colors = self._get_badge_colors()
-        if config['color'] != self._badge_color:
-            self._badge_color = config['color']
-            colors = self._get_badge_colors()
-
-        self.badge_label.setStyleSheet(f"""
-            QLabel {{
-                background-color: transparent;
-                color: {colors['bg']};
-                border-radius: 6px;
-                font-size: 12px;
-                font-weight: bold;
-            }}
-        """)
+        self.badge_label.setStyleSheet(self._get_status_stylesheet())
 
         self.badge_label.show()
 
+    def _get_status_stylesheet(self) -> str:
+        """Get the status dot stylesheet, shared per (badge color, theme)."""
+        key = (self._badge_color, theme_manager.get_current_theme())
+        stylesheet = StatusBadgeLabel._status_stylesheet_cache.get(key)
+        if stylesheet is None:
+            colors = self._get_badge_colors()
+            stylesheet = _STATUS_QSS.format(color=colors['bg'])
+            StatusBadgeLabel._status_stylesheet_cache[key] = stylesheet
+        return stylesheet
+
     def set_status(self, status: str):
         """Update status."""
         self._status = status
@@ -342,12 +392,10 @@ class AnimatedBadgeLabel(BadgeLabel):
 
     def __init__(self, text="", count=0, parent=None):
         super().__init__(text, count, parent=parent)
-        self._setup_animations()
+        self._bounce_animation = None  # Created on first animation
 
     def _setup_animations(self):
         """Setup animation effects."""
-        from PyQt6.QtCore import QPropertyAnimation, QSequentialAnimationGroup
-
         self._bounce_animation = QSequentialAnimationGroup()
 
         # Scale up
@@ -367,14 +415,17 @@ class AnimatedBadgeLabel(BadgeLabel):
         super().set_count(count)
 
         # Animate if count increased
-        if count > old_count and hasattr(self, '_bounce_animation'):
+        if count > old_count:
             self._animate_badge_change()
 
     def _animate_badge_change(self):
         """Animate badge when count changes."""
-        if not hasattr(self, 'badge_label') or not self.badge_label.isVisible():
+        if not self.badge_label.isVisible():
             return
 
+        if self._bounce_animation is None:
+            self._setup_animations()
+
         original_rect = self.badge_label.geometry()
         expanded_rect = original_rect.adjusted(-2, -2, 2, 2)
 
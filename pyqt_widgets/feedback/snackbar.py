@@ -2,23 +2,106 @@
 Snackbar widget for bottom-floating action messages.
 """
 
+from collections import deque
+from functools import partial
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel, QPushButton, QApplication
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QPropertyAnimation, QEasingCurve, QRect
 from PyQt6.QtGui import QFont
 from ..base.base_popup import BasePopupWidget
 from ..base.theme_manager import theme_manager
 
+# Stylesheet templates shared by all snackbars
+_SNACKBAR_QSS = """
+    {selector} {{
+        background-color: {bg};
+        border-radius: {radius}px;
+    }}
+"""
+
+_ACTION_BUTTON_QSS = """
+    QPushButton {{
+        border: none;
+        background-color: transparent;
+        color: {color};
+        font-weight: bold;
+        padding: 8px 12px;
+    }}
+    QPushButton:hover {{
+        background-color: rgba(255, 255, 255, 0.1);
+        border-radius: 4px;
+    }}
+"""
+
+_MULTI_ACTION_QSS = """
+    QPushButton[class="snackbar-action"] {{
+        border: none;
+        background-color: transparent;
+        color: {color};
+        font-weight: bold;
+        padding: 8px 12px;
+        margin-left: 4px;
+    }}
+    QPushButton[class="snackbar-action"]:hover {{
+        background-color: rgba(255, 255, 255, 0.1);
+        border-radius: 4px;
+    }}
+"""
+
+_CLOSE_BUTTON_QSS = """
+    QPushButton {
+        border: none;
+        background-color: transparent;
+        color: white;
+        font-size: 18px;
+    }
+    QPushButton:hover {
+        background-color: rgba(255, 255, 255, 0.1);
+        border-radius: 16px;
+    }
+"""
+
+# Primary screen's available geometry, dropped whenever it may have changed
+_screen_geometry = None
+_watched_screen = None
+
+
+def _invalidate_screen_geometry(*args):
+    """Forget the cached screen geometry."""
+    global _screen_geometry
+    _screen_geometry = None
+
+
+def _available_geometry():
+    """Get the primary screen's available geometry, cached between screen changes."""
+    global _screen_geometry, _watched_screen
+    if _screen_geometry is None:
+        app = QApplication.instance()
+        screen = app.primaryScreen()
+        if _watched_screen is None:
+            app.primaryScreenChanged.connect(_invalidate_screen_geometry)
+        if screen is not _watched_screen:
+            screen.availableGeometryChanged.connect(_invalidate_screen_geometry)
+            _watched_screen = screen
+        _screen_geometry = screen.availableGeometry()
+    return _screen_geometry
+
 
 class SnackbarWidget(BasePopupWidget):
     """Bottom-floating snackbar with optional action."""
 
     action_clicked = pyqtSignal()
 
+    # Subclasses that apply their own frame stylesheet skip the default one
+    _defer_default_style = False
+
     def __init__(self, message="", action_text="", duration=4000, parent=None):
         super().__init__(parent, modal=False)
         self._message = message
         self._action_text = action_text
         self._duration = duration
+        self.action_btn = None
+        self._closing = False
+        self._slide_animation = None  # Created on first show, reused after
         self._setup_snackbar_ui()
 
     def _setup_snackbar_ui(self):
@@ -31,6 +114,7 @@ class SnackbarWidget(BasePopupWidget):
         main_layout = QHBoxLayout()
         main_layout.setContentsMargins(16, 0, 8, 0)
         main_layout.setSpacing(16)
+        self._main_layout = main_layout
 
         # Message
         self.message_label = QLabel(self._message)
@@ -41,59 +125,45 @@ class SnackbarWidget(BasePopupWidget):
 
         main_layout.addStretch()
 
-        # Action button
-        if self._action_text:
-            self.action_btn = QPushButton(self._action_text)
-            self.action_btn.setFlat(True)
-            self.action_btn.clicked.connect(self._on_action_clicked)
-            self.action_btn.setStyleSheet(f"""
-                QPushButton {{
-                    border: none;
-                    background-color: transparent;
-                    color: {theme_manager.get_color('primary')};
-                    font-weight: bold;
-                    padding: 8px 12px;
-                }}
-                QPushButton:hover {{
-                    background-color: rgba(255, 255, 255, 0.1);
-                    border-radius: 4px;
-                }}
-            """)
-            main_layout.addWidget(self.action_btn)
-
         # Close button
         self.close_btn = QPushButton("×")
         self.close_btn.setFixedSize(32, 32)
         self.close_btn.setFlat(True)
         self.close_btn.clicked.connect(self.close_animated)
-        self.close_btn.setStyleSheet(f"""
-            QPushButton {{
-                border: none;
-                background-color: transparent;
-                color: white;
-                font-size: 18px;
-            }}
-            QPushButton:hover {{
-                background-color: rgba(255, 255, 255, 0.1);
-                border-radius: 16px;
-            }}
-        """)
+        self.close_btn.setStyleSheet(_CLOSE_BUTTON_QSS)
         main_layout.addWidget(self.close_btn)
 
+        # Action button
+        if self._action_text:
+            self._create_action_button()
+
         # Apply snackbar styling
-        self.setStyleSheet(f"""
-            SnackbarWidget {{
-                background-color: {theme_manager.get_color('dark')};
-                border-radius: {theme_manager.get_border_radius('md')}px;
-            }}
-        """)
+        if not self._defer_default_style:
+            self.setStyleSheet(_SNACKBAR_QSS.format(
+                selector="SnackbarWidget",
+                bg=theme_manager.get_color('dark'),
+                radius=theme_manager.get_border_radius('md')
+            ))
 
         # Set layout
         self.layout.addLayout(main_layout)
 
         # Auto-dismiss timer
         if self._duration > 0:
-            QTimer.singleShot(self._duration, self.close_animated)
+            self.auto_close(self._duration)
+
+    def _setup_styling(self):
+        """Skip the popup frame stylesheet; the snackbar applies its own."""
+        pass
+
+    def _create_action_button(self):
+        """Create the action button, placed before the close button."""
+        self.action_btn = QPushButton(self._action_text)
+        self.action_btn.setFlat(True)
+        self.action_btn.clicked.connect(self._on_action_clicked)
+        self.action_btn.setStyleSheet(
+            _ACTION_BUTTON_QSS.format(color=theme_manager.get_color('primary')))
+        self._main_layout.insertWidget(self._main_layout.indexOf(self.close_btn), self.action_btn)
 
     def _on_action_clicked(self):
         """Handle action button click."""
@@ -102,7 +172,7 @@ class SnackbarWidget(BasePopupWidget):
 
     def show_snackbar(self):
         """Show snackbar with slide-up animation."""
-        screen = QApplication.instance().primaryScreen().availableGeometry()
+        screen = _available_geometry()
 
         # Position at bottom center
         x = (screen.width() - self.width()) // 2
@@ -110,34 +180,51 @@ class SnackbarWidget(BasePopupWidget):
 
         # Start below screen
         start_y = screen.height()
+        self._closing = False
         self.move(x, start_y)
         self.show()
 
         # Animate slide up
-        animation = QPropertyAnimation(self, b"geometry")
+        animation = self._get_slide_animation()
         animation.setDuration(300)
         animation.setStartValue(QRect(x, start_y, self.width(), self.height()))
         animation.setEndValue(QRect(x, y, self.width(), self.height()))
         animation.setEasingCurve(QEasingCurve.Type.OutCubic)
         animation.start()
 
+    def _get_slide_animation(self) -> QPropertyAnimation:
+        """Get the slide animation, stopping any slide in progress."""
+        if self._slide_animation is None:
+            self._slide_animation = QPropertyAnimation(self, b"geometry", self)
+            self._slide_animation.finished.connect(self._on_slide_finished)
+        else:
+            self._slide_animation.stop()
+        return self._slide_animation
+
+    def _on_slide_finished(self):
+        """Close once the slide-down animation completes."""
+        if self._closing:
+            self.close()
+            self.closed.emit()
+
     def close_animated(self):
         """Close with slide-down animation."""
-        screen = QApplication.instance().primaryScreen().availableGeometry()
+        # Close button, action and timer may all ask; only close once
+        if self._closing:
+            return
+        self._closing = True
+        if self._auto_close_timer:
+            self._auto_close_timer.stop()
+
+        screen = _available_geometry()
         current_rect = self.geometry()
         end_y = screen.height()
 
-        animation = QPropertyAnimation(self, b"geometry")
+        animation = self._get_slide_animation()
         animation.setDuration(250)
         animation.setStartValue(current_rect)
         animation.setEndValue(QRect(current_rect.x(), end_y, current_rect.width(), current_rect.height()))
         animation.setEasingCurve(QEasingCurve.Type.InCubic)
-
-        def on_animation_finished():
-            self.close()
-            self.closed.emit()
-
-        animation.finished.connect(on_animation_finished)
         animation.start()
 
     def set_message(self, message: str):
@@ -148,8 +235,19 @@ class SnackbarWidget(BasePopupWidget):
     def set_action_text(self, action_text: str):
         """Update action button text."""
         self._action_text = action_text
-        if hasattr(self, 'action_btn'):
+        if self.action_btn is not None:
             self.action_btn.setText(action_text)
+            self.action_btn.setVisible(bool(action_text))
+        elif action_text:
+            self._create_action_button()
+
+    def set_duration(self, duration: int):
+        """Update auto-dismiss delay in ms, restarting the countdown (0 disables)."""
+        self._duration = duration
+        if duration > 0:
+            self.auto_close(duration)
+        elif self._auto_close_timer:
+            self._auto_close_timer.stop()
 
     def get_message(self) -> str:
         """Get current message."""
@@ -164,8 +262,9 @@ class SnackbarManager:
     """Manager for displaying snackbars sequentially."""
 
     def __init__(self):
-        self._queue = []
+        self._queue = deque()
         self._current_snackbar = None
+        self._snackbar = None  # Reused for every message
 
     def show_snackbar(self, message: str, action_text: str = "", duration: int = 4000):
         """Show snackbar, queuing if another is active."""
@@ -182,13 +281,19 @@ class SnackbarManager:
 
     def _show_next_snackbar(self, snackbar_info: dict):
         """Show the next snackbar."""
-        self._current_snackbar = SnackbarWidget(
-            snackbar_info['message'],
-            snackbar_info['action_text'],
-            snackbar_info['duration']
-        )
+        if self._snackbar is None:
+            self._snackbar = SnackbarWidget(
+                snackbar_info['message'],
+                snackbar_info['action_text'],
+                snackbar_info['duration']
+            )
+            self._snackbar.closed.connect(self._on_snackbar_closed)
+        else:
+            self._snackbar.set_message(snackbar_info['message'])
+            self._snackbar.set_action_text(snackbar_info['action_text'])
+            self._snackbar.set_duration(snackbar_info['duration'])
 
-        self._current_snackbar.closed.connect(self._on_snackbar_closed)
+        self._current_snackbar = self._snackbar
         self._current_snackbar.show_snackbar()
 
     def _on_snackbar_closed(self):
@@ -196,7 +301,7 @@ class SnackbarManager:
         self._current_snackbar = None
 
         if self._queue:
-            next_snackbar = self._queue.pop(0)
+            next_snackbar = self._queue.popleft()
             self._show_next_snackbar(next_snackbar)
 
     def clear_queue(self):
@@ -236,6 +341,8 @@ def show_retry_snackbar(message: str, duration: int = 6000):
 class CustomSnackbar(SnackbarWidget):
     """Customizable snackbar with different styles."""
 
+    _defer_default_style = True
+
     def __init__(self, message="", action_text="", duration=4000,
                  style="default", parent=None):
         self._style = style
@@ -274,30 +381,21 @@ class CustomSnackbar(SnackbarWidget):
 
         style_config = styles.get(self._style, styles['default'])
 
-        self.setStyleSheet(f"""
-            CustomSnackbar {{
-                background-color: {style_config['bg']};
-                border-radius: {theme_manager.get_border_radius('md')}px;
-            }}
-        """)
+        self.setStyleSheet(_SNACKBAR_QSS.format(
+            selector="CustomSnackbar",
+            bg=style_config['bg'],
+            radius=theme_manager.get_border_radius('md')
+        ))
 
-        if hasattr(self, 'message_label'):
-            self.message_label.setStyleSheet(f"color: {style_config['text']};")
-
-        if hasattr(self, 'action_btn'):
-            self.action_btn.setStyleSheet(f"""
-                QPushButton {{
-                    border: none;
-                    background-color: transparent;
-                    color: {style_config['action']};
-                    font-weight: bold;
-                    padding: 8px 12px;
-                }}
-                QPushButton:hover {{
-                    background-color: rgba(255, 255, 255, 0.1);
-                    border-radius: 4px;
-                }}
-            """)
+        # Restyle children only when the style differs from the defaults
+        message_qss = f"color: {style_config['text']};"
+        if self.message_label.styleSheet() != message_qss:
+            self.message_label.setStyleSheet(message_qss)
+
+        if self.action_btn is not None:
+            action_qss = _ACTION_BUTTON_QSS.format(color=style_config['action'])
+            if self.action_btn.styleSheet() != action_qss:
+                self.action_btn.setStyleSheet(action_qss)
 
 
 class PersistentSnackbar(SnackbarWidget):
@@ -347,8 +445,7 @@ class ProgressSnackbar(SnackbarWidget):
     def set_progress(self, progress: int):
         """Update progress (0-100)."""
         self._progress = progress
-        if hasattr(self, 'progress_bar'):
-            self.progress_bar.setValue(progress)
+        self.progress_bar.setValue(progress)
 
         # Auto-close when complete
         if progress >= 100:
@@ -373,28 +470,19 @@ class MultiActionSnackbar(SnackbarWidget):
             return
 
         # Remove single action button if it exists
-        if hasattr(self, 'action_btn'):
+        if self.action_btn is not None:
             self.action_btn.setParent(None)
 
+        # One rule on the snackbar styles every action button
+        self.setStyleSheet(self.styleSheet() + _MULTI_ACTION_QSS.format(
+            color=theme_manager.get_color('primary')))
+
         # Add multiple action buttons
         for action_text, callback in self._actions:
             action_btn = QPushButton(action_text)
             action_btn.setFlat(True)
-            action_btn.clicked.connect(lambda checked, cb=callback: self._on_multi_action_clicked(cb))
-            action_btn.setStyleSheet(f"""
-                QPushButton {{
-                    border: none;
-                    background-color: transparent;
-                    color: {theme_manager.get_color('primary')};
-                    font-weight: bold;
-                    padding: 8px 12px;
-                    margin-left: 4px;
-                }}
-                QPushButton:hover {{
-                    background-color: rgba(255, 255, 255, 0.1);
-                    border-radius: 4px;
-                }}
-            """)
+            action_btn.clicked.connect(partial(self._on_multi_action_clicked, callback))
+            action_btn.setProperty('class', 'snackbar-action')
 
             # Add to main layout (before close button)
             if hasattr(self, 'layout') and self.layout.count() > 0:
@@ -403,7 +491,7 @@ class MultiActionSnackbar(SnackbarWidget):
                     # Insert before close button (last item)
                     main_layout.insertWidget(main_layout.count() - 1, action_btn)
 
-    def _on_multi_action_clicked(self, callback):
+    def _on_multi_action_clicked(self, callback, checked=False):
         """Handle multi-action button click."""
         if callable(callback):
             callback()
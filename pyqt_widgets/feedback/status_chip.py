@@ -2,23 +2,89 @@
 Status chip widget for displaying colored status indicators.
 """
 
-from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+from functools import lru_cache, partial
+from PyQt6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLabel
+from PyQt6.QtCore import (Qt, pyqtSignal, QAbstractAnimation, QPropertyAnimation,
+                          QSequentialAnimationGroup)
+from PyQt6.QtGui import QColor, QFont
 from ..base.theme_manager import theme_manager
 
+# Status -> (bg, text, border) theme color keys; None text means white
+_STATUS_COLOR_KEYS = {
+    'default': ('light', 'text', 'border'),
+    'primary': ('primary', None, 'primary'),
+    'success': ('success', None, 'success'),
+    'warning': ('warning', None, 'warning'),
+    'error': ('danger', None, 'danger'),
+    'info': ('info', None, 'info'),
+    'inactive': ('text_secondary', None, 'text_secondary')
+}
+
+# Statuses with fixed colors, independent of the theme
+_STATUS_FIXED_COLORS = {
+    'active': '#10B981',  # Green
+    'pending': '#F59E0B',  # Amber
+    'draft': '#6B7280'  # Gray
+}
+
+_STATUS_NAMES = tuple(_STATUS_COLOR_KEYS) + tuple(_STATUS_FIXED_COLORS)
+
+
+@lru_cache(maxsize=64)
+def _darken(color: str, factor: int = 120) -> str:
+    """Darken a color name by a QColor.darker() factor (cached)."""
+    return QColor(color).darker(factor).name()
+
 
 class StatusChipWidget(QWidget):
     """Colored pill widget for status display."""
 
     clicked = pyqtSignal()
 
+    # Container stylesheets keyed by (size, status, clickable, theme)
+    _stylesheet_cache = {}
+
+    # Chips styled by an ancestor's get_shared_stylesheet() set properties instead
+    _shared_style = False
+
+    # Size-specific properties
+    _SIZE_TABLE = {
+        'small': {
+            'height': 20,
+            'padding_h': 8,
+            'padding_v': 2,
+            'spacing': 4,
+            'icon_size': 12,
+            'font_size': 10,
+            'border_radius': 10
+        },
+        'medium': {
+            'height': 24,
+            'padding_h': 12,
+            'padding_v': 4,
+            'spacing': 6,
+            'icon_size': 14,
+            'font_size': 11,
+            'border_radius': 12
+        },
+        'large': {
+            'height': 32,
+            'padding_h': 16,
+            'padding_v': 6,
+            'spacing': 8,
+            'icon_size': 16,
+            'font_size': 12,
+            'border_radius': 16
+        }
+    }
+
     def __init__(self, text="", status="default", size="medium",
                  clickable=False, icon=None, parent=None):
         super().__init__(parent)
         self._text = text
         self._status = status
         self._size = size
+        self._size_props = self._SIZE_TABLE.get(size, self._SIZE_TABLE['medium'])
         self._clickable = clickable
         self._icon = icon
         self._setup_ui()
@@ -31,13 +97,14 @@ class StatusChipWidget(QWidget):
         layout.setSpacing(0)
 
         # Get size properties
-        size_props = self._get_size_properties()
+        size_props = self._size_props
 
         # Set fixed height based on size
         self.setFixedHeight(size_props['height'])
 
         # Inner container for proper padding and styling
         self.container = QWidget()
+        self.container.setObjectName("chipContainer")
         container_layout = QHBoxLayout(self.container)
         container_layout.setContentsMargins(
             size_props['padding_h'],
@@ -49,16 +116,7 @@ class StatusChipWidget(QWidget):
 
         # Icon
         if self._icon:
-            self.icon_label = QLabel()
-            if isinstance(self._icon, str):
-                # Text icon (emoji or symbol)
-                self.icon_label.setText(self._icon)
-            else:
-                # QIcon or QPixmap
-                self.icon_label.setPixmap(self._icon.pixmap(size_props['icon_size'], size_props['icon_size']))
-
-            self.icon_label.setFixedSize(size_props['icon_size'], size_props['icon_size'])
-            self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            self._create_icon_label()
             container_layout.addWidget(self.icon_label)
 
         # Text label
@@ -76,136 +134,139 @@ class StatusChipWidget(QWidget):
         if self._clickable:
             self.setCursor(Qt.CursorShape.PointingHandCursor)
 
+    def _create_icon_label(self):
+        """Create the icon label for the current icon."""
+        icon_size = self._size_props['icon_size']
+        self.icon_label = QLabel()
+        if isinstance(self._icon, str):
+            # Text icon (emoji or symbol)
+            self.icon_label.setText(self._icon)
+        else:
+            # QIcon or QPixmap
+            self.icon_label.setPixmap(self._icon.pixmap(icon_size, icon_size))
+
+        self.icon_label.setFixedSize(icon_size, icon_size)
+        self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
     def _get_size_properties(self):
         """Get size-specific properties."""
-        sizes = {
-            'small': {
-                'height': 20,
-                'padding_h': 8,
-                'padding_v': 2,
-                'spacing': 4,
-                'icon_size': 12,
-                'font_size': 10,
-                'border_radius': 10
-            },
-            'medium': {
-                'height': 24,
-                'padding_h': 12,
-                'padding_v': 4,
-                'spacing': 6,
-                'icon_size': 14,
-                'font_size': 11,
-                'border_radius': 12
-            },
-            'large': {
-                'height': 32,
-                'padding_h': 16,
-                'padding_v': 6,
-                'spacing': 8,
-                'icon_size': 16,
-                'font_size': 12,
-                'border_radius': 16
-            }
-        }
-
-        return sizes.get(self._size, sizes['medium'])
+        return self._size_props
 
     def _get_font(self):
         """Get font for current size."""
-        font = theme_manager.get_font('default')
-        size_props = self._get_size_properties()
-        font.setPointSize(size_props['font_size'])
+        # Copy: the theme's font object is shared by every widget
+        font = QFont(theme_manager.get_font('default'))
+        font.setPointSize(self._size_props['font_size'])
         font.setWeight(QFont.Weight.Medium)
         return font
 
     def _apply_styling(self):
         """Apply status-specific styling."""
-        status_colors = {
-            'default': {
-                'bg': theme_manager.get_color('light'),
-                'text': theme_manager.get_color('text'),
-                'border': theme_manager.get_color('border')
-            },
-            'primary': {
-                'bg': theme_manager.get_color('primary'),
-                'text': 'white',
-                'border': theme_manager.get_color('primary')
-            },
-            'success': {
-                'bg': theme_manager.get_color('success'),
-                'text': 'white',
-                'border': theme_manager.get_color('success')
-            },
-            'warning': {
-                'bg': theme_manager.get_color('warning'),
-                'text': 'white',
-                'border': theme_manager.get_color('warning')
-            },
-            'error': {
-                'bg': theme_manager.get_color('danger'),
-                'text': 'white',
-                'border': theme_manager.get_color('danger')
-            },
-            'info': {
-                'bg': theme_manager.get_color('info'),
-                'text': 'white',
-                'border': theme_manager.get_color('info')
-            },
-            'active': {
-                'bg': '#10B981',  # Green
-                'text': 'white',
-                'border': '#10B981'
-            },
-            'inactive': {
-                'bg': theme_manager.get_color('text_secondary'),
-                'text': 'white',
-                'border': theme_manager.get_color('text_secondary')
-            },
-            'pending': {
-                'bg': '#F59E0B',  # Amber
-                'text': 'white',
-                'border': '#F59E0B'
-            },
-            'draft': {
-                'bg': '#6B7280',  # Gray
-                'text': 'white',
-                'border': '#6B7280'
-            }
-        }
-
-        colors = status_colors.get(self._status, status_colors['default'])
-        size_props = self._get_size_properties()
-
-        hover_style = ""
-        if self._clickable:
-            hover_style = f"""
-                QWidget:hover {{
-                    background-color: {self._darken_color(colors['bg'])};
-                }}
+        if self._shared_style:
+            self._apply_style_properties()
+            return
+
+        # One stylesheet on the container also covers the text and icon labels
+        self.container.setStyleSheet(self._get_stylesheet())
+
+    def _apply_style_properties(self):
+        """Select the ancestor's shared rules through dynamic properties."""
+        status = self._status if self._status in _STATUS_NAMES else 'default'
+        self.container.setProperty('chipPart', 'container')
+        self.container.setProperty('clickable', self._clickable)
+        labels = [self.text_label]
+        if hasattr(self, 'icon_label'):
+            labels.append(self.icon_label)
+        for label in labels:
+            label.setProperty('chipPart', 'label')
+
+        # Changing a property does not restyle; repolish to rematch the rules
+        for widget in [self.container] + labels:
+            widget.setProperty('status', status)
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
+
+    @classmethod
+    def get_shared_stylesheet(cls, size: str = "medium") -> str:
+        """Get a stylesheet styling every status for chips with _shared_style."""
+        key = ("shared", size, theme_manager.get_current_theme())
+        stylesheet = StatusChipWidget._stylesheet_cache.get(key)
+        if stylesheet is None:
+            radius = cls._SIZE_TABLE.get(size, cls._SIZE_TABLE['medium'])['border_radius']
+            rules = []
+            for status in _STATUS_NAMES:
+                colors = cls._get_status_colors(status)
+                rules.append(f"""
+            QWidget[chipPart="container"][status="{status}"] {{
+                background-color: {colors['bg']};
+                border: 1px solid {colors['border']};
+                border-radius: {radius}px;
+                color: {colors['text']};
+            }}
+            QWidget[chipPart="container"][status="{status}"][clickable="true"]:hover {{
+                background-color: {cls._darken_color(colors['bg'])};
+            }}
+            QLabel[chipPart="label"][status="{status}"] {{
+                color: {colors['text']};
+                background: transparent;
+                border: none;
+            }}
+        """)
+            stylesheet = "".join(rules)
+            StatusChipWidget._stylesheet_cache[key] = stylesheet
+        return stylesheet
+
+    def _get_stylesheet(self):
+        """Get the container stylesheet, shared per look and theme."""
+        key = (self._size, self._status, self._clickable, theme_manager.get_current_theme())
+        stylesheet = StatusChipWidget._stylesheet_cache.get(key)
+        if stylesheet is None:
+            colors = self._get_status_colors(self._status)
+            size_props = self._size_props
+
+            hover_style = ""
+            if self._clickable:
+                hover_style = f"""
+            QWidget#chipContainer:hover {{
+                background-color: {self._darken_color(colors['bg'])};
+            }}
             """
 
-        self.container.setStyleSheet(f"""
-            QWidget {{
+            stylesheet = f"""
+            QWidget#chipContainer {{
                 background-color: {colors['bg']};
                 border: 1px solid {colors['border']};
                 border-radius: {size_props['border_radius']}px;
                 color: {colors['text']};
             }}
             {hover_style}
-        """)
-
-        # Update text and icon colors
-        self.text_label.setStyleSheet(f"color: {colors['text']}; background: transparent; border: none;")
-
-        if hasattr(self, 'icon_label'):
-            self.icon_label.setStyleSheet(f"color: {colors['text']}; background: transparent; border: none;")
+            QWidget#chipContainer QLabel {{
+                color: {colors['text']};
+                background: transparent;
+                border: none;
+            }}
+        """
+            StatusChipWidget._stylesheet_cache[key] = stylesheet
+        return stylesheet
+
+    @staticmethod
+    def _get_status_colors(status: str) -> dict:
+        """Resolve bg/text/border colors for a status."""
+        fixed = _STATUS_FIXED_COLORS.get(status)
+        if fixed:
+            return {'bg': fixed, 'text': 'white', 'border': fixed}
+
+        bg_key, text_key, border_key = _STATUS_COLOR_KEYS.get(status, _STATUS_COLOR_KEYS['default'])
+        return {
+            'bg': theme_manager.get_color(bg_key),
+            'text': theme_manager.get_color(text_key) if text_key else 'white',
+            'border': theme_manager.get_color(border_key)
+        }
 
-    def _darken_color(self, color: str) -> str:
+    @staticmethod
+    def _darken_color(color: str) -> str:
         """Darken a color for hover effect."""
-        # Simple darkening - in real implementation, you'd use QColor
-        if color.startswith('#'):
-            return color  # Return same for now
-        return color
+        return _darken(color)
 
     def mousePressEvent(self, event):
         """Handle mouse press for clickable chips."""
@@ -215,11 +276,15 @@ class StatusChipWidget(QWidget):
 
     def set_text(self, text: str):
         """Update chip text."""
+        if text == self._text:
+            return
         self._text = text
         self.text_label.setText(text)
 
     def set_status(self, status: str):
         """Update chip status."""
+        if status == self._status:
+            return
         self._status = status
         self._apply_styling()
 
@@ -230,11 +295,19 @@ class StatusChipWidget(QWidget):
             if isinstance(icon, str):
                 self.icon_label.setText(icon)
             else:
-                size_props = self._get_size_properties()
+                size_props = self._size_props
                 self.icon_label.setPixmap(icon.pixmap(size_props['icon_size'], size_props['icon_size']))
         else:
-            # Recreate UI to add icon
-            self._setup_ui()
+            # Insert the icon ahead of the text without rebuilding the chip
+            self.container.setUpdatesEnabled(False)
+            try:
+                self._create_icon_label()
+                # The container's stylesheet already styles the new label
+                if self._shared_style:
+                    self._apply_style_properties()
+                self.container.layout().insertWidget(0, self.icon_label)
+            finally:
+                self.container.setUpdatesEnabled(True)
 
     def set_clickable(self, clickable: bool):
         """Set whether chip is clickable."""
@@ -258,6 +331,12 @@ class StatusChipWidget(QWidget):
         return self._clickable
 
 
+class _GroupStatusChip(StatusChipWidget):
+    """Status chip styled by its StatusChipGroup's shared stylesheet."""
+
+    _shared_style = True
+
+
 class StatusChipGroup(QWidget):
     """Group of status chips."""
 
@@ -266,6 +345,7 @@ class StatusChipGroup(QWidget):
     def __init__(self, orientation=Qt.Orientation.Horizontal, parent=None):
         super().__init__(parent)
         self._chips = []
+        self._chips_by_text = {}  # text -> chips with that text, in insertion order
         self._orientation = orientation
         self._setup_ui()
 
@@ -274,37 +354,67 @@ class StatusChipGroup(QWidget):
         if self._orientation == Qt.Orientation.Horizontal:
             self.layout = QHBoxLayout(self)
         else:
-            from PyQt6.QtWidgets import QVBoxLayout
             self.layout = QVBoxLayout(self)
 
         self.layout.setContentsMargins(0, 0, 0, 0)
         self.layout.setSpacing(8)
         self.layout.addStretch()
 
+        # One stylesheet for every chip in the group
+        self.setStyleSheet(StatusChipWidget.get_shared_stylesheet("medium"))
+
     def add_chip(self, text: str, status: str = "default", clickable: bool = False):
         """Add chip to group."""
-        chip = StatusChipWidget(text, status, "medium", clickable)
+        chip = _GroupStatusChip(text, status, "medium", clickable)
         if clickable:
-            chip.clicked.connect(lambda: self.chip_clicked.emit(text, status))
+            chip.clicked.connect(partial(self.chip_clicked.emit, text, status))
 
         self._chips.append(chip)
+        self._chips_by_text.setdefault(text, []).append(chip)
         self.layout.insertWidget(self.layout.count() - 1, chip)
 
         return chip
 
+    def add_chips(self, items) -> list:
+        """Add (text, status, clickable) chips with a single relayout."""
+        self.setUpdatesEnabled(False)
+        try:
+            chips = [self.add_chip(text, status, clickable)
+                     for text, status, clickable in items]
+        finally:
+            self.setUpdatesEnabled(True)
+        self.updateGeometry()
+        return chips
+
     def remove_chip(self, text: str):
         """Remove chip by text."""
-        for i, chip in enumerate(self._chips):
-            if chip.get_text() == text:
-                chip.setParent(None)
-                del self._chips[i]
-                break
+        chips = self._chips_by_text.get(text)
+        if not chips:
+            return
+
+        chip = chips.pop(0)
+        if not chips:
+            del self._chips_by_text[text]
+
+        self._chips.remove(chip)
+        chip.setParent(None)
+        chip.deleteLater()
 
     def clear_chips(self):
         """Remove all chips."""
-        for chip in self._chips:
-            chip.setParent(None)
-        self._chips.clear()
+        if not self._chips:
+            return
+
+        self.setUpdatesEnabled(False)
+        try:
+            for chip in self._chips:
+                chip.setParent(None)
+                chip.deleteLater()
+            self._chips.clear()
+            self._chips_by_text.clear()
+        finally:
+            self.setUpdatesEnabled(True)
+        self.updateGeometry()
 
     def get_chips(self) -> list:
         """Get list of chip texts."""
@@ -350,26 +460,38 @@ class AnimatedStatusChip(StatusChipWidget):
 
     def _setup_animations(self):
         """Setup animation effects."""
-        from PyQt6.QtCore import QPropertyAnimation
+        self._pulse_animation = QSequentialAnimationGroup(self)
 
-        self._pulse_animation = QPropertyAnimation(self, b"geometry")
-        self._pulse_animation.setDuration(200)
+        # Expand
+        expand = QPropertyAnimation(self, b"geometry")
+        expand.setDuration(200)
+
+        # Return to original size
+        contract = QPropertyAnimation(self, b"geometry")
+        contract.setDuration(200)
+
+        self._pulse_animation.addAnimation(expand)
+        self._pulse_animation.addAnimation(contract)
 
     def pulse_effect(self):
         """Trigger pulse animation."""
-        original_rect = self.geometry()
+        # A pulse still running ends back at its own original geometry
+        if self._pulse_animation.state() == QAbstractAnimation.State.Running:
+            original_rect = self._pulse_animation.animationAt(1).endValue()
+            self._pulse_animation.stop()
+        else:
+            original_rect = self.geometry()
         expanded_rect = original_rect.adjusted(-2, -1, 2, 1)
 
-        self._pulse_animation.setStartValue(original_rect)
-        self._pulse_animation.setEndValue(expanded_rect)
+        expand = self._pulse_animation.animationAt(0)
+        contract = self._pulse_animation.animationAt(1)
 
-        # Return to original size
-        def return_to_normal():
-            self._pulse_animation.setStartValue(expanded_rect)
-            self._pulse_animation.setEndValue(original_rect)
-            self._pulse_animation.start()
+        expand.setStartValue(original_rect)
+        expand.setEndValue(expanded_rect)
+
+        contract.setStartValue(expanded_rect)
+        contract.setEndValue(original_rect)
 
-        self._pulse_animation.finished.connect(return_to_normal)
         self._pulse_animation.start()
 
     def set_status(self, status: str):
@@ -391,6 +513,8 @@ class CounterChip(StatusChipWidget):
 
     def set_count(self, count: int):
         """Update counter value."""
+        if count == self._count:
+            return
         self._count = count
         text = f"{self._label} ({count})" if self._label else str(count)
         self.set_text(text)
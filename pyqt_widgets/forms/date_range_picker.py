@@ -3,15 +3,104 @@ Date range picker widget with calendar popup.
 """
 
 from PyQt6.QtWidgets import (QWidget, QHBoxLayout, QVBoxLayout, QLineEdit,
-                             QPushButton, QCalendarWidget, QLabel, QFrame,
-                             QApplication)
-from PyQt6.QtCore import Qt, pyqtSignal, QDate, QPoint, QTimer
-from PyQt6.QtGui import QIcon, QPainter, QPixmap
+                             QPushButton, QCalendarWidget, QLabel)
+from PyQt6.QtCore import pyqtSignal, QDate, QPoint, QTimer
 from ..base.theme_manager import theme_manager
 from ..base.base_popup import BasePopupWidget
-from datetime import datetime, date
+from functools import partial
 from typing import Optional, Tuple
 
+_INPUT_QSS = """
+    QLineEdit {{
+        border: 1px solid {border};
+        border-radius: {radius}px;
+        padding: 6px 8px;
+        background-color: {background};
+        color: {text};
+        min-width: 100px;
+    }}
+    QLineEdit:focus {{
+        border-color: {primary};
+    }}
+    QLineEdit:hover {{
+        border-color: {hover};
+    }}
+"""
+
+_CALENDAR_BUTTON_QSS = """
+    QPushButton {{
+        border: 1px solid {border};
+        border-radius: {radius}px;
+        background-color: {surface};
+        color: {text};
+    }}
+    QPushButton:hover {{
+        background-color: {hover};
+    }}
+    QPushButton:pressed {{
+        background-color: {primary};
+    }}
+"""
+
+_PRESET_BUTTON_QSS = """
+    QPushButton {{
+        border: 1px solid {border};
+        border-radius: {radius}px;
+        padding: 4px 8px;
+        background-color: {surface};
+        color: {text};
+        font-size: 8pt;
+    }}
+    QPushButton:hover {{
+        background-color: {hover};
+    }}
+"""
+
+_CALENDAR_QSS = """
+    QCalendarWidget {{
+        background-color: {background};
+        color: {text};
+    }}
+    QCalendarWidget QTableView {{
+        selection-background-color: {primary};
+    }}
+"""
+
+_SEPARATOR_QSS = "color: {text_secondary};"
+
+# Formatted stylesheets keyed by (template, theme)
+_stylesheet_cache = {}
+
+
+def _get_stylesheet(template: str) -> str:
+    """Fill a stylesheet template with the current theme's values (cached)."""
+    key = (template, theme_manager.get_current_theme())
+    stylesheet = _stylesheet_cache.get(key)
+    if stylesheet is None:
+        color = theme_manager.get_color
+        stylesheet = template.format(
+            border=color('border'),
+            background=color('background'),
+            surface=color('surface'),
+            text=color('text'),
+            text_secondary=color('text_secondary'),
+            primary=color('primary'),
+            hover=color('hover'),
+            radius=theme_manager.get_border_radius('sm')
+        )
+        _stylesheet_cache[key] = stylesheet
+    return stylesheet
+
+
+class _ClickableLineEdit(QLineEdit):
+    """Line edit that reports mouse presses through a signal."""
+
+    clicked = pyqtSignal()
+
+    def mousePressEvent(self, event):
+        """Emit clicked instead of placing the cursor."""
+        self.clicked.emit()
+
 
 class DateRangePickerWidget(QWidget):
     """Date range picker with calendar popup."""
@@ -35,22 +124,22 @@ class DateRangePickerWidget(QWidget):
         layout.setSpacing(8)
 
         # Start date input
-        self.start_input = QLineEdit()
+        self.start_input = _ClickableLineEdit()
         self.start_input.setPlaceholderText("Start date")
         self.start_input.setReadOnly(True)
-        self.start_input.mousePressEvent = lambda e: self._show_calendar(True)
+        self.start_input.clicked.connect(partial(self._show_calendar, True))
         layout.addWidget(self.start_input)
 
         # Separator
         separator = QLabel("to")
-        separator.setStyleSheet(f"color: {theme_manager.get_color('text_secondary')};")
+        separator.setStyleSheet(_get_stylesheet(_SEPARATOR_QSS))
         layout.addWidget(separator)
 
         # End date input
-        self.end_input = QLineEdit()
+        self.end_input = _ClickableLineEdit()
         self.end_input.setPlaceholderText("End date")
         self.end_input.setReadOnly(True)
-        self.end_input.mousePressEvent = lambda e: self._show_calendar(False)
+        self.end_input.clicked.connect(partial(self._show_calendar, False))
         layout.addWidget(self.end_input)
 
         # Calendar button
@@ -60,52 +149,24 @@ class DateRangePickerWidget(QWidget):
         layout.addWidget(self.calendar_btn)
 
         # Style inputs
-        input_style = f"""
-            QLineEdit {{
-                border: 1px solid {theme_manager.get_color('border')};
-                border-radius: {theme_manager.get_border_radius('sm')}px;
-                padding: 6px 8px;
-                background-color: {theme_manager.get_color('background')};
-                color: {theme_manager.get_color('text')};
-                min-width: 100px;
-            }}
-            QLineEdit:focus {{
-                border-color: {theme_manager.get_color('primary')};
-            }}
-            QLineEdit:hover {{
-                border-color: {theme_manager.get_color('hover')};
-            }}
-        """
-
+        input_style = _get_stylesheet(_INPUT_QSS)
         self.start_input.setStyleSheet(input_style)
         self.end_input.setStyleSheet(input_style)
 
         # Style button
-        self.calendar_btn.setStyleSheet(f"""
-            QPushButton {{
-                border: 1px solid {theme_manager.get_color('border')};
-                border-radius: {theme_manager.get_border_radius('sm')}px;
-                background-color: {theme_manager.get_color('surface')};
-                color: {theme_manager.get_color('text')};
-            }}
-            QPushButton:hover {{
-                background-color: {theme_manager.get_color('hover')};
-            }}
-            QPushButton:pressed {{
-                background-color: {theme_manager.get_color('primary')};
-            }}
-        """)
+        self.calendar_btn.setStyleSheet(_get_stylesheet(_CALENDAR_BUTTON_QSS))
 
     def _show_calendar(self, selecting_start: bool):
         """Show calendar popup."""
         self._selecting_start = selecting_start
 
-        if self._popup:
-            self._popup.close()
-
-        self._popup = DateRangeCalendarPopup(self._start_date, self._end_date, self)
-        self._popup.date_selected.connect(self._on_date_selected)
-        self._popup.range_selected.connect(self._on_range_selected)
+        # Build the calendar popup once and reset it on later opens
+        if self._popup is None:
+            self._popup = DateRangeCalendarPopup(self._start_date, self._end_date, self)
+            self._popup.date_selected.connect(self._on_date_selected)
+            self._popup.range_selected.connect(self._on_range_selected)
+        else:
+            self._popup.reset(self._start_date, self._end_date)
 
         # Position popup below the widget
         global_pos = self.mapToGlobal(QPoint(0, self.height()))
@@ -147,16 +208,23 @@ class DateRangePickerWidget(QWidget):
 
     def set_date_range(self, start_date: QDate, end_date: QDate):
         """Set both start and end dates."""
+        start_changed = start_date != self._start_date
+        end_changed = end_date != self._end_date
+        if not (start_changed or end_changed):
+            return
+
         self._start_date = start_date
         self._end_date = end_date
 
-        self.start_input.setText(start_date.toString("yyyy-MM-dd") if start_date else "")
-        self.end_input.setText(end_date.toString("yyyy-MM-dd") if end_date else "")
-
-        if start_date:
-            self.start_date_changed.emit(start_date)
-        if end_date:
-            self.end_date_changed.emit(end_date)
+        # Emit per-date signals only for dates that changed, and the range once
+        if start_changed:
+            self.start_input.setText(start_date.toString("yyyy-MM-dd") if start_date else "")
+            if start_date:
+                self.start_date_changed.emit(start_date)
+        if end_changed:
+            self.end_input.setText(end_date.toString("yyyy-MM-dd") if end_date else "")
+            if end_date:
+                self.end_date_changed.emit(end_date)
 
         if start_date and end_date:
             self.date_range_changed.emit(start_date, end_date)
@@ -187,6 +255,15 @@ class DateRangeCalendarPopup(BasePopupWidget):
     date_selected = pyqtSignal(object)  # QDate
     range_selected = pyqtSignal(object, object)  # start_date, end_date
 
+    # (label, start offset, end offset) in days from today
+    _PRESETS = (
+        ("Today", 0, 0),
+        ("Yesterday", -1, -1),
+        ("Last 7 days", -6, 0),
+        ("Last 30 days", -29, 0),
+        ("This month", "month_start", "month_end")
+    )
+
     def __init__(self, start_date=None, end_date=None, parent=None):
         super().__init__(parent)
         self._start_date = start_date
@@ -203,31 +280,11 @@ class DateRangeCalendarPopup(BasePopupWidget):
         # Header with preset ranges
         header_layout = QHBoxLayout()
 
-        presets = [
-            ("Today", 0, 0),
-            ("Yesterday", -1, -1),
-            ("Last 7 days", -6, 0),
-            ("Last 30 days", -29, 0),
-            ("This month", "month_start", "month_end")
-        ]
-
-        for label, start_offset, end_offset in presets:
+        preset_style = _get_stylesheet(_PRESET_BUTTON_QSS)
+        for label, start_offset, end_offset in self._PRESETS:
             btn = QPushButton(label)
-            btn.clicked.connect(lambda checked, s=start_offset, e=end_offset:
-                                self._select_preset(s, e))
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    border: 1px solid {theme_manager.get_color('border')};
-                    border-radius: {theme_manager.get_border_radius('sm')}px;
-                    padding: 4px 8px;
-                    background-color: {theme_manager.get_color('surface')};
-                    color: {theme_manager.get_color('text')};
-                    font-size: 8pt;
-                }}
-                QPushButton:hover {{
-                    background-color: {theme_manager.get_color('hover')};
-                }}
-            """)
+            btn.clicked.connect(partial(self._on_preset_clicked, start_offset, end_offset))
+            btn.setStyleSheet(preset_style)
             header_layout.addWidget(btn)
 
         layout.addLayout(header_layout)
@@ -238,15 +295,7 @@ class DateRangeCalendarPopup(BasePopupWidget):
         self.calendar.clicked.connect(self._on_calendar_clicked)
 
         # Style calendar
-        self.calendar.setStyleSheet(f"""
-            QCalendarWidget {{
-                background-color: {theme_manager.get_color('background')};
-                color: {theme_manager.get_color('text')};
-            }}
-            QCalendarWidget QTableView {{
-                selection-background-color: {theme_manager.get_color('primary')};
-            }}
-        """)
+        self.calendar.setStyleSheet(_get_stylesheet(_CALENDAR_QSS))
 
         layout.addWidget(self.calendar)
 
@@ -269,6 +318,20 @@ class DateRangeCalendarPopup(BasePopupWidget):
         if self._start_date:
             self.calendar.setSelectedDate(self._start_date)
 
+    def reset(self, start_date=None, end_date=None):
+        """Reset the popup to a new range before it is shown again."""
+        self._start_date = start_date
+        self._end_date = end_date
+        self._temp_start = None
+        self._temp_end = None
+
+        if start_date:
+            self.calendar.setSelectedDate(start_date)
+
+    def _on_preset_clicked(self, start_offset, end_offset, checked=False):
+        """Handle preset button click."""
+        self._select_preset(start_offset, end_offset)
+
     def _select_preset(self, start_offset, end_offset):
         """Select a preset date range."""
         today = QDate.currentDate()
@@ -323,6 +386,14 @@ class SimpleDateRangePicker(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._last_emitted = None
+
+        # Validate once typing pauses rather than on every keystroke
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(150)
+        self._debounce.timeout.connect(self._do_validate)
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -344,28 +415,31 @@ class SimpleDateRangePicker(QWidget):
         layout.addWidget(self.end_input)
 
     def _validate_dates(self):
+        """Schedule validation of the date range."""
+        self._debounce.start()
+
+    def _do_validate(self):
         """Validate and emit date range."""
-        try:
-            start_text = self.start_input.text()
-            end_text = self.end_input.text()
+        start_text = self.start_input.text()
+        end_text = self.end_input.text()
+        if not (start_text and end_text):
+            return
 
-            if start_text and end_text:
-                start_date = QDate.fromString(start_text, "yyyy-MM-dd")
-                end_date = QDate.fromString(end_text, "yyyy-MM-dd")
+        # QDate.fromString never raises; unparsable text gives an invalid date
+        start_date = QDate.fromString(start_text, "yyyy-MM-dd")
+        end_date = QDate.fromString(end_text, "yyyy-MM-dd")
 
-                if start_date.isValid() and end_date.isValid():
-                    self.date_range_changed.emit(start_date, end_date)
-        except:
-            pass
+        if start_date.isValid() and end_date.isValid():
+            date_range = (start_date, end_date)
+            if date_range != self._last_emitted:
+                self._last_emitted = date_range
+                self.date_range_changed.emit(start_date, end_date)
 
     def get_date_range(self):
         """Get current date range."""
-        try:
-            start_date = QDate.fromString(self.start_input.text(), "yyyy-MM-dd")
-            end_date = QDate.fromString(self.end_input.text(), "yyyy-MM-dd")
-
-            if start_date.isValid() and end_date.isValid():
-                return (start_date, end_date)
-        except:
-            pass
-        return (None, None)
\ No newline at end of file
+        start_date = QDate.fromString(self.start_input.text(), "yyyy-MM-dd")
+        end_date = QDate.fromString(self.end_input.text(), "yyyy-MM-dd")
+
+        if start_date.isValid() and end_date.isValid():
+            return (start_date, end_date)
+        return (None, None)
@@ -4,9 +4,10 @@ Form stepper widget for multi-step form navigation.
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                              QPushButton, QFrame, QStackedWidget, QProgressBar)
-from PyQt6.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve
-from PyQt6.QtGui import QPainter, QPen, QBrush, QFont
+from PyQt6.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve, QRect
+from PyQt6.QtGui import QPainter, QPainterPath, QPen, QBrush, QColor, QFont, QFontMetrics
 from ..base.theme_manager import theme_manager
+from types import MappingProxyType
 from typing import List, Dict, Any
 
 
@@ -17,6 +18,9 @@ class FormStepperWidget(QWidget):
     step_completed = pyqtSignal(int)  # Emits completed step index
     form_completed = pyqtSignal(dict)  # Emits all form data
 
+    # Stylesheets keyed by (part, theme), shared by all instances
+    _stylesheet_cache = {}
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._steps = []
@@ -37,14 +41,7 @@ class FormStepperWidget(QWidget):
 
         # Content area
         self.content_stack = QStackedWidget()
-        self.content_stack.setStyleSheet(f"""
-            QStackedWidget {{
-                background-color: {theme_manager.get_color('background')};
-                border: 1px solid {theme_manager.get_color('border')};
-                border-radius: {theme_manager.get_border_radius('md')}px;
-                padding: 16px;
-            }}
-        """)
+        self.content_stack.setStyleSheet(self._get_stylesheet("content"))
         layout.addWidget(self.content_stack)
 
         # Navigation buttons
@@ -69,7 +66,41 @@ class FormStepperWidget(QWidget):
         layout.addLayout(nav_layout)
 
         # Style buttons
-        button_style = f"""
+        button_style = self._get_stylesheet("button")
+        self.prev_btn.setStyleSheet(button_style)
+        self.next_btn.setStyleSheet(button_style)
+        self.finish_btn.setStyleSheet(button_style)
+
+    @classmethod
+    def _get_stylesheet(cls, part: str) -> str:
+        """Get the stylesheet for a widget part, shared per theme."""
+        key = (part, theme_manager.get_current_theme())
+        stylesheet = FormStepperWidget._stylesheet_cache.get(key)
+        if stylesheet is None:
+            builders = {
+                "content": cls._build_content_stylesheet,
+                "button": cls._build_button_stylesheet,
+            }
+            stylesheet = builders[part]()
+            FormStepperWidget._stylesheet_cache[key] = stylesheet
+        return stylesheet
+
+    @staticmethod
+    def _build_content_stylesheet() -> str:
+        """Build the content area stylesheet."""
+        return f"""
+            QStackedWidget {{
+                background-color: {theme_manager.get_color('background')};
+                border: 1px solid {theme_manager.get_color('border')};
+                border-radius: {theme_manager.get_border_radius('md')}px;
+                padding: 16px;
+            }}
+        """
+
+    @staticmethod
+    def _build_button_stylesheet() -> str:
+        """Build the navigation button stylesheet."""
+        return f"""
             QPushButton {{
                 background-color: {theme_manager.get_color('primary')};
                 color: white;
@@ -88,10 +119,6 @@ class FormStepperWidget(QWidget):
             }}
         """
 
-        self.prev_btn.setStyleSheet(button_style)
-        self.next_btn.setStyleSheet(button_style)
-        self.finish_btn.setStyleSheet(button_style)
-
     def add_step(self, title: str, widget: QWidget, description: str = "",
                  validation_func=None):
         """Add a step to the form."""
@@ -188,8 +215,8 @@ class FormStepperWidget(QWidget):
         self._completed_steps.add(self._current_step)
         self.step_completed.emit(self._current_step)
 
-        # Emit completion signal with all data
-        self.form_completed.emit(self._step_data.copy())
+        # Emit completion signal with a copy receivers may mutate
+        self.form_completed.emit(self.snapshot())
 
     def set_step_data(self, step_index: int, data: dict):
         """Set data for a specific step."""
@@ -199,8 +226,12 @@ class FormStepperWidget(QWidget):
         """Get data for a specific step."""
         return self._step_data.get(step_index, {})
 
-    def get_all_data(self) -> dict:
-        """Get all form data."""
+    def get_all_data(self) -> MappingProxyType:
+        """Get a read-only live view of all form data."""
+        return MappingProxyType(self._step_data)
+
+    def snapshot(self) -> dict:
+        """Get a detached copy of all form data."""
         return self._step_data.copy()
 
     def get_current_step(self) -> int:
@@ -231,6 +262,7 @@ class StepProgressIndicator(QWidget):
         self._steps = []
         self._current_step = 0
         self._completed_steps = set()
+        self._theme_cache_key = None
         self.setFixedHeight(80)
 
     def add_step(self, title: str, description: str = ""):
@@ -246,93 +278,157 @@ class StepProgressIndicator(QWidget):
 
     def set_current_step(self, step_index: int):
         """Set current active step."""
+        if step_index == self._current_step:
+            return
+
+        # Only the old and new current steps change appearance
+        old_step = self._current_step
         self._current_step = step_index
-        self.update()
+        self.update(self._rect_for_step(old_step))
+        self.update(self._rect_for_step(step_index))
 
     def set_completed_steps(self, completed_steps: set):
         """Set completed steps."""
+        completed_steps = set(completed_steps)
+        changed = completed_steps ^ self._completed_steps
         self._completed_steps = completed_steps
-        self.update()
+
+        # A completed step recolors its circle and the line to the next step
+        for i in changed:
+            self.update(self._rect_for_step(i).united(self._rect_for_step(i + 1)))
+
+    def _step_width(self) -> float:
+        """Get the horizontal distance between step centers."""
+        width = self.width() - 40  # Margins
+        return width / len(self._steps) if len(self._steps) > 1 else width
+
+    def _rect_for_step(self, index: int) -> QRect:
+        """Get the area painted for a step's circle and title."""
+        step_width = self._step_width()
+        rect_width = max(80, int(step_width))
+        center_x = int(20 + index * step_width)
+        return QRect(center_x - rect_width // 2, 0, rect_width, self.height())
+
+    def _refresh_theme_cache(self):
+        """Resolve the pens, brushes and fonts used for painting."""
+        active_color = QColor(theme_manager.get_color('primary'))
+        completed_color = QColor(theme_manager.get_color('success'))
+        inactive_color = QColor(theme_manager.get_color('border'))
+
+        # Connecting line pens
+        self._completed_line_pen = QPen(QBrush(completed_color), 2)
+        self._inactive_line_pen = QPen(QBrush(inactive_color), 2)
+
+        # Circle brush, circle pen and circle text pen per step state
+        white_pen = QPen(QBrush(QColor('white')), 1)
+        self._completed_style = (QBrush(completed_color), QPen(QBrush(completed_color), 1), white_pen)
+        self._active_style = (QBrush(active_color), QPen(QBrush(active_color), 1), white_pen)
+        self._inactive_style = (
+            QBrush(inactive_color),
+            QPen(QBrush(inactive_color), 1),
+            QPen(QBrush(QColor(theme_manager.get_color('text_secondary'))), 1)
+        )
+
+        self._text_pen = QPen(QBrush(QColor(theme_manager.get_color('text'))), 1)
+
+        self._font_default = QFont(theme_manager.get_font('default'))
+        self._font_default_bold = QFont(self._font_default)
+        self._font_default_bold.setBold(True)
+
+        # Text bounding rects keyed by (bold, text), measured with these fonts
+        self._font_metrics = {
+            False: QFontMetrics(self._font_default),
+            True: QFontMetrics(self._font_default_bold)
+        }
+        self._text_rect_cache = {}
+
+        self._theme_cache_key = theme_manager.get_current_theme()
+
+    def _measure(self, text: str, bold: bool) -> QRect:
+        """Get the bounding rect of text in the default or bold font (cached)."""
+        key = (bold, text)
+        rect = self._text_rect_cache.get(key)
+        if rect is None:
+            rect = self._font_metrics[bold].boundingRect(text)
+            self._text_rect_cache[key] = rect
+        return rect
 
     def paintEvent(self, event):
         """Paint the progress indicator."""
         if not self._steps:
             return
 
+        if self._theme_cache_key != theme_manager.get_current_theme():
+            self._refresh_theme_cache()
+
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Calculate positions
-        width = self.width() - 40  # Margins
-        step_width = width / len(self._steps) if len(self._steps) > 1 else width
-
-        # Colors
-        active_color = theme_manager.get_color('primary')
-        completed_color = theme_manager.get_color('success')
-        inactive_color = theme_manager.get_color('border')
-        text_color = theme_manager.get_color('text')
+        step_width = self._step_width()
+        dirty_rect = event.rect()
 
         # Draw connecting lines
         if len(self._steps) > 1:
             line_y = 25
-            painter.setPen(QPen(QBrush(inactive_color), 2))
+
+            # Collect segments per color and stroke each color once
+            completed_path = QPainterPath()
+            inactive_path = QPainterPath()
 
             for i in range(len(self._steps) - 1):
                 x1 = 20 + i * step_width + 15  # Circle center + radius
                 x2 = 20 + (i + 1) * step_width - 15  # Next circle center - radius
 
                 # Change color if step is completed
-                if i in self._completed_steps:
-                    painter.setPen(QPen(QBrush(completed_color), 2))
-                else:
-                    painter.setPen(QPen(QBrush(inactive_color), 2))
+                path = completed_path if i in self._completed_steps else inactive_path
+                path.moveTo(x1, line_y)
+                path.lineTo(x2, line_y)
 
-                painter.drawLine(x1, line_y, x2, line_y)
+            painter.strokePath(inactive_path, self._inactive_line_pen)
+            painter.strokePath(completed_path, self._completed_line_pen)
 
         # Draw step circles and labels
         for i, step in enumerate(self._steps):
+            # Skip steps outside the region being repainted
+            if not dirty_rect.intersects(self._rect_for_step(i)):
+                continue
+
             x = 20 + i * step_width
             circle_center_x = x
             circle_y = 25
 
-            # Determine circle color
+            # Determine circle style
             if i in self._completed_steps:
-                circle_color = completed_color
-                text_color_circle = 'white'
+                circle_brush, circle_pen, circle_text_pen = self._completed_style
                 circle_text = "✓"
             elif i == self._current_step:
-                circle_color = active_color
-                text_color_circle = 'white'
+                circle_brush, circle_pen, circle_text_pen = self._active_style
                 circle_text = str(i + 1)
             else:
-                circle_color = inactive_color
-                text_color_circle = theme_manager.get_color('text_secondary')
+                circle_brush, circle_pen, circle_text_pen = self._inactive_style
                 circle_text = str(i + 1)
 
             # Draw circle
-            painter.setBrush(QBrush(circle_color))
-            painter.setPen(QPen(QBrush(circle_color), 1))
+            painter.setBrush(circle_brush)
+            painter.setPen(circle_pen)
             painter.drawEllipse(circle_center_x - 15, circle_y - 15, 30, 30)
 
             # Draw circle text
-            painter.setPen(QPen(QBrush(text_color_circle), 1))
-            font = QFont(theme_manager.get_font('default'))
-            font.setBold(True)
-            painter.setFont(font)
+            painter.setPen(circle_text_pen)
+            painter.setFont(self._font_default_bold)
 
-            text_rect = painter.fontMetrics().boundingRect(circle_text)
+            text_rect = self._measure(circle_text, True)
             text_x = circle_center_x - text_rect.width() // 2
             text_y = circle_y + text_rect.height() // 2 - 2
             painter.drawText(text_x, text_y, circle_text)
 
             # Draw step title
-            painter.setPen(QPen(QBrush(text_color), 1))
-            title_font = QFont(theme_manager.get_font('default'))
-            if i == self._current_step:
-                title_font.setBold(True)
-            painter.setFont(title_font)
+            painter.setPen(self._text_pen)
+            title_bold = i == self._current_step
+            painter.setFont(self._font_default_bold if title_bold else self._font_default)
 
-            title_rect = painter.fontMetrics().boundingRect(step['title'])
+            title_rect = self._measure(step['title'], title_bold)
             title_x = circle_center_x - title_rect.width() // 2
             title_y = circle_y + 25
             painter.drawText(title_x, title_y, step['title'])
@@ -2,11 +2,46 @@
 Inline edit label widget - editable text label on double-click.
 """
 
-from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel, QLineEdit
+import re
+from functools import partial
+from PyQt6.QtWidgets import (QWidget, QHBoxLayout, QVBoxLayout, QLabel, QLayout,
+                             QLineEdit, QStackedWidget, QTextEdit)
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
 from ..base.theme_manager import theme_manager
 
+# Email address format
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Simple phone validation - digits, spaces, dashes, parentheses
+_PHONE_RE = re.compile(r'^[\d\s\-\(\)\+]+$')
+
+# Phone separators left out of the digit count
+_PHONE_STRIP_RE = re.compile(r'[ \-()+]')
+
+# http(s) URL format
+_URL_RE = re.compile(r'^https?://[^\s/$.?#].[^\s]*$')
+
+
+class _CurrentPageStack(QStackedWidget):
+    """Stacked widget sized by its current page alone."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Don't let the hidden pages' minimum sizes constrain the stack
+        self.layout().setSizeConstraint(QLayout.SizeConstraint.SetNoConstraint)
+        self.currentChanged.connect(self.updateGeometry)
+
+    def sizeHint(self):
+        """Get the current page's size hint."""
+        page = self.currentWidget()
+        return page.sizeHint() if page else super().sizeHint()
+
+    def minimumSizeHint(self):
+        """Get the current page's minimum size hint."""
+        page = self.currentWidget()
+        return page.minimumSizeHint() if page else super().minimumSizeHint()
+
 
 class InlineEditLabel(QWidget):
     """Label that becomes editable on double-click."""
@@ -39,12 +74,14 @@ class InlineEditLabel(QWidget):
         else:
             self.display_label.setStyleSheet(f"color: {theme_manager.get_color('text_secondary')};")
 
-        layout.addWidget(self.display_label)
+        # Display and edit pages share one slot; only the current page is shown
+        self._stack = _CurrentPageStack()
+        self._stack.addWidget(self.display_label)
+        layout.addWidget(self._stack)
 
-        # Edit input (hidden by default)
+        # Edit input (second page, shown while editing)
         self.edit_input = QLineEdit()
         self.edit_input.setText(self._text)
-        self.edit_input.hide()
         self.edit_input.returnPressed.connect(self._finish_editing)
         self.edit_input.editingFinished.connect(self._finish_editing)
 
@@ -57,7 +94,7 @@ class InlineEditLabel(QWidget):
             }}
         """)
 
-        layout.addWidget(self.edit_input)
+        self._stack.addWidget(self.edit_input)
 
         # Make label clickable
         self.display_label.mouseDoubleClickEvent = self._start_editing
@@ -76,8 +113,7 @@ class InlineEditLabel(QWidget):
             return
 
         self._is_editing = True
-        self.display_label.hide()
-        self.edit_input.show()
+        self._stack.setCurrentWidget(self.edit_input)
         self.edit_input.setFocus()
         self.edit_input.selectAll()
 
@@ -89,27 +125,25 @@ class InlineEditLabel(QWidget):
             return
 
         new_text = self.edit_input.text().strip()
+        changed = new_text != self._text
 
-        # Validate if validation function provided
-        if self._validation_func and not self._validation_func(new_text):
+        # Validate if validation function provided; unchanged text is kept as is
+        if changed and self._validation_func and not self._validation_func(new_text):
             # Invalid input - revert to original text
             self.edit_input.setText(self._text)
             return
 
-        # Update text
-        old_text = self._text
-        self._text = new_text
-
-        # Update display
-        self._update_display()
+        # Update text and display only when the text changed
+        if changed:
+            self._text = new_text
+            self._update_display()
 
         # Switch back to display mode
         self._is_editing = False
-        self.edit_input.hide()
-        self.display_label.show()
+        self._stack.setCurrentWidget(self.display_label)
 
         # Emit signals
-        if new_text != old_text:
+        if changed:
             self.text_changed.emit(new_text)
         self.editing_finished.emit(new_text)
 
@@ -166,27 +200,24 @@ class MultilineInlineEdit(InlineEditLabel):
 
     def _setup_multiline(self):
         """Setup multiline editing."""
-        from PyQt6.QtWidgets import QTextEdit
-
         # Replace line edit with text edit
+        self._stack.removeWidget(self.edit_input)
         self.edit_input.setParent(None)
 
         self.edit_input = QTextEdit()
         self.edit_input.setPlainText(self._text)
         self.edit_input.setMaximumHeight(100)
-        self.edit_input.hide()
 
         # Connect signals differently for QTextEdit
         self.edit_input.focusOutEvent = self._on_focus_out
 
-        self.layout().addWidget(self.edit_input)
+        self._stack.addWidget(self.edit_input)
 
         # Update display label for multiline
         self.display_label.setWordWrap(True)
 
     def _on_focus_out(self, event):
         """Handle focus out for text edit."""
-        from PyQt6.QtWidgets import QTextEdit
         QTextEdit.focusOutEvent(self.edit_input, event)
         self._finish_editing()
 
@@ -196,21 +227,19 @@ class MultilineInlineEdit(InlineEditLabel):
             return
 
         new_text = self.edit_input.toPlainText().strip()
+        changed = new_text != self._text
 
-        # Update text
-        old_text = self._text
-        self._text = new_text
-
-        # Update display
-        self._update_display()
+        # Update text and display only when the text changed
+        if changed:
+            self._text = new_text
+            self._update_display()
 
         # Switch back to display mode
         self._is_editing = False
-        self.edit_input.hide()
-        self.display_label.show()
+        self._stack.setCurrentWidget(self.display_label)
 
         # Emit signals
-        if new_text != old_text:
+        if changed:
             self.text_changed.emit(new_text)
         self.editing_finished.emit(new_text)
 
@@ -256,9 +285,7 @@ class ValidatedInlineEdit(InlineEditLabel):
 
     def _validate_email(self, text: str) -> bool:
         """Validate email format."""
-        import re
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, text))
+        return bool(_EMAIL_RE.match(text))
 
     def _validate_number(self, text: str) -> bool:
         """Validate number format."""
@@ -270,17 +297,11 @@ class ValidatedInlineEdit(InlineEditLabel):
 
     def _validate_phone(self, text: str) -> bool:
         """Validate phone number format."""
-        import re
-        # Simple phone validation - digits, spaces, dashes, parentheses
-        pattern = r'^[\d\s\-\(\)\+]+$'
-        return bool(re.match(pattern, text)) and len(
-            text.replace(' ', '').replace('-', '').replace('(', '').replace(')', '').replace('+', '')) >= 10
+        return bool(_PHONE_RE.match(text)) and len(_PHONE_STRIP_RE.sub('', text)) >= 10
 
     def _validate_url(self, text: str) -> bool:
         """Validate URL format."""
-        import re
-        pattern = r'^https?://[^\s/$.?#].[^\s]*$'
-        return bool(re.match(pattern, text))
+        return bool(_URL_RE.match(text))
 
 
 class InlineEditGroup(QWidget):
@@ -295,8 +316,6 @@ class InlineEditGroup(QWidget):
 
     def _setup_ui(self):
         """Setup group UI."""
-        from PyQt6.QtWidgets import QVBoxLayout
-
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)
         self.layout.setSpacing(8)
@@ -323,7 +342,7 @@ class InlineEditGroup(QWidget):
         else:
             editor = InlineEditLabel(initial_value)
 
-        editor.text_changed.connect(lambda text, n=name: self._on_editor_changed(n, text))
+        editor.text_changed.connect(partial(self._on_editor_changed, name))
         container_layout.addWidget(editor)
 
         self._editors[name] = editor
@@ -332,8 +351,7 @@ class InlineEditGroup(QWidget):
     def _on_editor_changed(self, name: str, text: str):
         """Handle editor change."""
         # Emit all current values
-        values = {name: editor.get_text() for name, editor in self._editors.items()}
-        self.group_changed.emit(values)
+        self.group_changed.emit(self.get_values())
 
     def get_values(self) -> dict:
         """Get all editor values."""
@@ -341,6 +359,7 @@ class InlineEditGroup(QWidget):
 
     def set_values(self, values: dict):
         """Set values for all editors."""
+        # set_text() does not emit text_changed, so this never fires group_changed
         for name, value in values.items():
             if name in self._editors:
                 self._editors[name].set_text(str(value))